@@ -4,6 +4,7 @@ import logging
 import time
 from dataclasses import dataclass
 from decimal import Decimal
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 import boto3
@@ -44,9 +45,10 @@ class ScheduleData:
     metadata: dict[str, Any] = None
 
 
+@cache
 def ddb() -> Any:
     """
-    DynamoDB resource.
+    DynamoDB resource, created once and reused across calls.
 
     Returns:
         boto3.resources.factory.dynamodb.ServiceResource: DDB resource.
@@ -54,9 +56,10 @@ def ddb() -> Any:
     return boto3.resource("dynamodb", region_name=settings.aws_region)
 
 
+@cache
 def table(name: str) -> Any:
     """
-    Get a DynamoDB table handle.
+    Get a DynamoDB table handle, cached per table name.
 
     Args:
         name: Table name.
@@ -67,6 +70,59 @@ def table(name: str) -> Any:
     return ddb().Table(name)
 
 
+def _now() -> Decimal:
+    """Current time as a DynamoDB-ready epoch timestamp."""
+    return Decimal(str(time.time()))
+
+
+def capture_item(data: CaptureData) -> dict[str, Any]:
+    """
+    Build the DynamoDB item for a capture record.
+
+    Args:
+        data: Capture data to store.
+
+    Returns:
+        dict: Item ready for put_item.
+    """
+    return {
+        "capture_id": data.capture_id,
+        "created_at": _now(),
+        "url": data.url,
+        "sha256": data.sha256,
+        "s3_key": data.s3_key,
+        "artifact_type": data.artifact_type,
+        "user_id": data.user_id,
+        "status": "completed",
+        "metadata": data.metadata or {},
+    }
+
+
+def schedule_item(data: ScheduleData) -> dict[str, Any]:
+    """
+    Build the DynamoDB item for a schedule record.
+
+    Args:
+        data: Schedule data to store.
+
+    Returns:
+        dict: Item ready for put_item.
+    """
+    timestamp = _now()
+    return {
+        "schedule_id": data.schedule_id,
+        "user_id": data.user_id,
+        "url": data.url,
+        "cron_expression": data.cron_expression,
+        "artifact_type": data.artifact_type,
+        "enabled": data.enabled,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "next_capture_time": timestamp,  # Will be updated by scheduler
+        "metadata": data.metadata or {},
+    }
+
+
 # Capture Operations
 def create_capture(data: CaptureData = None, **kwargs) -> dict[str, Any]:
     """
@@ -93,19 +149,7 @@ def create_capture(data: CaptureData = None, **kwargs) -> dict[str, Any]:
 
     captures_table = table(settings.ddb_table_captures)
 
-    timestamp = Decimal(str(time.time()))
-
-    item = {
-        "capture_id": data.capture_id,
-        "created_at": timestamp,
-        "url": data.url,
-        "sha256": data.sha256,
-        "s3_key": data.s3_key,
-        "artifact_type": data.artifact_type,
-        "user_id": data.user_id,
-        "status": "completed",
-        "metadata": data.metadata or {},
-    }
+    item = capture_item(data)
 
     try:
         captures_table.put_item(Item=item)
@@ -228,20 +272,7 @@ def create_schedule(data: ScheduleData = None, **kwargs) -> dict[str, Any]:
 
     schedules_table = table(settings.ddb_table_schedules)
 
-    timestamp = Decimal(str(time.time()))
-
-    item = {
-        "schedule_id": data.schedule_id,
-        "user_id": data.user_id,
-        "url": data.url,
-        "cron_expression": data.cron_expression,
-        "artifact_type": data.artifact_type,
-        "enabled": data.enabled,
-        "created_at": timestamp,
-        "updated_at": timestamp,
-        "next_capture_time": timestamp,  # Will be updated by scheduler
-        "metadata": data.metadata or {},
-    }
+    item = schedule_item(data)
 
     try:
         schedules_table.put_item(Item=item)
@@ -345,7 +376,7 @@ def update_schedule(
 
     # Build update expression with attribute name mapping for reserved keywords
     update_expr = "SET updated_at = :updated_at"
-    expr_values = {":updated_at": Decimal(str(time.time()))}
+    expr_values = {":updated_at": _now()}
     expr_attr_names = {}
 
     for key, value in updates.items():
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timedelta, timezone
+from functools import cache
 from typing import TYPE_CHECKING, Any
 
 import boto3
@@ -20,9 +21,10 @@ MAX_PRESIGN_TTL_SECONDS = 900  # 15 minutes max for security
 DEFAULT_RETENTION_DAYS = 2555  # ~7 years default
 
 
+@cache
 def s3_client() -> Any:
     """
-    Create an S3 client with recommended defaults.
+    S3 client with recommended defaults, created once and reused across calls.
 
     Returns:
         botocore.client.S3: S3 client.
@@ -4,17 +4,42 @@ Auto-update TASK.md based on actual implementation completion.
 Detects when acceptance criteria are met and automatically checks them off.
 """
 
+import hashlib
+import json
 import os
 import re
 import subprocess
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 
+# Tokens looked up in route and DynamoDB sources; each file is scanned once per token
+_API_TOKENS = ("POST", "GET", "schedules", "captures", "trigger")
+_DYNAMO_TOKENS = (
+    "schedules",
+    "captures",
+    "aws_dynamodb_table",
+    "global_secondary_index",
+    "server_side_encryption",
+)
+
+
+def _present_tokens(content: str, tokens: tuple[str, ...]) -> set[str]:
+    """Return the subset of tokens that occur in content."""
+    return {token for token in tokens if token in content}
+
 
 class TaskAutoUpdater:
     def __init__(self, repo_root: Path):
         self.repo_root = repo_root
         self.task_file = repo_root / "TASK.md"
+        # Compiled task-section patterns, keyed by task name
+        self._task_patterns: dict[str, re.Pattern[str]] = {}
+        # Per-file check results from previous runs, keyed by path and mtime and discarded
+        # whenever this script changes
+        self.cache_file = repo_root / ".cache" / "taskupdater.json"
+        self._cache = self._load_cache()
+        self._cache_dirty = False
 
     def detect_completions(self) -> dict[str, list[str]]:
         """Detect which acceptance criteria have been completed."""
@@ -29,6 +54,56 @@ class TaskAutoUpdater:
         # Security & Compliance Tasks
         completions.update(self._check_security_completions())
 
+        self._save_cache()
+        return completions
+
+    def _load_cache(self) -> dict:
+        """Load cached check results from the previous run of this version of the script."""
+        # Reason: results depend on the checkers and criteria in this file, not just its inputs
+        version = hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()
+        empty: dict = {"version": version, "files": {}}
+        try:
+            cache = json.loads(self.cache_file.read_text())
+        except (OSError, ValueError):
+            return empty
+        if not isinstance(cache, dict) or not isinstance(cache.get("files"), dict):
+            return empty
+        if cache.get("version") != version:
+            return empty
+        return cache
+
+    def _save_cache(self) -> None:
+        """Persist check results so unchanged files are skipped on the next run."""
+        if not self._cache_dirty:
+            return
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            self.cache_file.write_text(json.dumps(self._cache, indent=2, sort_keys=True))
+            self._cache_dirty = False
+        except OSError as e:
+            print(f"Warning: Could not write cache {self.cache_file}: {e}")
+
+    def _cached_result(self, path: Path) -> dict[str, list[str]] | None:
+        """Return the cached result for a file if it is unchanged since it was checked."""
+        entry = self._cache["files"].get(str(path))
+        if entry is None:
+            return None
+        try:
+            if path.stat().st_mtime_ns != entry.get("mtime_ns"):
+                return None
+        except OSError:
+            return None
+        return entry.get("completions")
+
+    def _remember_result(
+        self, path: Path, completions: dict[str, list[str]]
+    ) -> dict[str, list[str]]:
+        """Record the result of checking a file against its current mtime."""
+        self._cache["files"][str(path)] = {
+            "mtime_ns": path.stat().st_mtime_ns,
+            "completions": completions,
+        }
+        self._cache_dirty = True
         return completions
 
     def _check_s3_completions(self, infra_dir: Path) -> dict[str, list[str]]:
@@ -38,6 +113,10 @@ class TaskAutoUpdater:
         if not s3_file.exists():
             return completions
 
+        cached = self._cached_result(s3_file)
+        if cached is not None:
+            return cached
+
         content = s3_file.read_text()
         s3_criteria = []
 
@@ -58,7 +137,7 @@ class TaskAutoUpdater:
         if s3_criteria:
             completions["Configure S3 Buckets with Object Lock"] = s3_criteria
 
-        return completions
+        return self._remember_result(s3_file, completions)
 
     def _check_kms_completions(self, infra_dir: Path) -> dict[str, list[str]]:
         """Check KMS task completions."""
@@ -67,6 +146,10 @@ class TaskAutoUpdater:
         if not kms_file.exists():
             return completions
 
+        cached = self._cached_result(kms_file)
+        if cached is not None:
+            return cached
+
         content = kms_file.read_text()
         kms_criteria = []
 
@@ -79,7 +162,7 @@ class TaskAutoUpdater:
         if kms_criteria:
             completions["Set up KMS Keys"] = kms_criteria
 
-        return completions
+        return self._remember_result(kms_file, completions)
 
     def _check_dynamo_completions(self, infra_dir: Path) -> dict[str, list[str]]:
         """Check DynamoDB task completions."""
@@ -88,25 +171,29 @@ class TaskAutoUpdater:
         if not dynamo_file.exists():
             return completions
 
-        content = dynamo_file.read_text()
+        cached = self._cached_result(dynamo_file)
+        if cached is not None:
+            return cached
+
+        present = _present_tokens(dynamo_file.read_text(), _DYNAMO_TOKENS)
         dynamo_criteria = []
 
-        if "schedules" in content and "aws_dynamodb_table" in content:
+        if {"schedules", "aws_dynamodb_table"} <= present:
             dynamo_criteria.append("Schedules table created with correct schema")
 
-        if "captures" in content and "aws_dynamodb_table" in content:
+        if {"captures", "aws_dynamodb_table"} <= present:
             dynamo_criteria.append("Captures table created with correct schema")
 
-        if "global_secondary_index" in content:
+        if "global_secondary_index" in present:
             dynamo_criteria.append("GSIs configured for query patterns")
 
-        if "server_side_encryption" in content:
+        if "server_side_encryption" in present:
             dynamo_criteria.append("Encryption at rest enabled with KMS")
 
         if dynamo_criteria:
             completions["Configure DynamoDB Tables"] = dynamo_criteria
 
-        return completions
+        return self._remember_result(dynamo_file, completions)
 
     def _check_terraform_completions(self) -> dict[str, list[str]]:
         """Check infrastructure task completions."""
@@ -130,6 +217,10 @@ class TaskAutoUpdater:
         if not engine_file.exists():
             return completions
 
+        cached = self._cached_result(engine_file)
+        if cached is not None:
+            return cached
+
         content = engine_file.read_text()
         capture_criteria = []
 
@@ -148,7 +239,7 @@ class TaskAutoUpdater:
         if capture_criteria:
             completions["Implement CaptureLambda"] = capture_criteria
 
-        return completions
+        return self._remember_result(engine_file, completions)
 
     def _check_api_completions(self, app_dir: Path) -> dict[str, list[str]]:
         """Check API implementation completions."""
@@ -162,26 +253,40 @@ class TaskAutoUpdater:
         if not routes_dir.exists():
             return completions
 
+        task_name = "Implement API Lambda Functions"
+
         # Check schedules API
         schedules_file = routes_dir / "schedules.py"
         if schedules_file.exists():
-            schedules_content = schedules_file.read_text()
-            if "POST" in schedules_content and "schedules" in schedules_content:
-                api_criteria.append("POST /api/schedules creates schedule with all fields")
-            if "GET" in schedules_content and "schedules" in schedules_content:
-                api_criteria.append("GET /api/schedules returns user's schedules")
+            cached = self._cached_result(schedules_file)
+            if cached is None:
+                present = _present_tokens(schedules_file.read_text(), _API_TOKENS)
+                schedules_criteria = []
+                if {"POST", "schedules"} <= present:
+                    schedules_criteria.append(
+                        "POST /api/schedules creates schedule with all fields"
+                    )
+                if {"GET", "schedules"} <= present:
+                    schedules_criteria.append("GET /api/schedules returns user's schedules")
+                cached = self._remember_result(schedules_file, {task_name: schedules_criteria})
+            api_criteria.extend(cached.get(task_name, []))
 
         # Check captures API
         captures_file = routes_dir / "captures.py"
         if captures_file.exists():
-            captures_content = captures_file.read_text()
-            if "trigger" in captures_content and "POST" in captures_content:
-                api_criteria.append("POST /api/captures/trigger works with rate limiting")
-            if "GET" in captures_content and "captures" in captures_content:
-                api_criteria.append("GET /api/captures supports all filter parameters")
+            cached = self._cached_result(captures_file)
+            if cached is None:
+                present = _present_tokens(captures_file.read_text(), _API_TOKENS)
+                captures_criteria = []
+                if {"POST", "trigger"} <= present:
+                    captures_criteria.append("POST /api/captures/trigger works with rate limiting")
+                if {"GET", "captures"} <= present:
+                    captures_criteria.append("GET /api/captures supports all filter parameters")
+                cached = self._remember_result(captures_file, {task_name: captures_criteria})
+            api_criteria.extend(cached.get(task_name, []))
 
         if api_criteria:
-            completions["Implement API Lambda Functions"] = api_criteria
+            completions[task_name] = api_criteria
 
         return completions
 
@@ -207,20 +312,25 @@ class TaskAutoUpdater:
         infra_dir = self.repo_root / "infra"
         cloudtrail_file = infra_dir / "cloudtrail.tf"
         if cloudtrail_file.exists():
-            content = cloudtrail_file.read_text()
-            trail_criteria = []
+            cached = self._cached_result(cloudtrail_file)
+            if cached is None:
+                content = cloudtrail_file.read_text()
+                trail_criteria = []
 
-            if "aws_cloudtrail" in content:
-                trail_criteria.append("Trail created for all API calls")
+                if "aws_cloudtrail" in content:
+                    trail_criteria.append("Trail created for all API calls")
 
-            if "data_resource" in content and "s3" in content.lower():
-                trail_criteria.append("S3 data events enabled for artifacts bucket")
+                if "data_resource" in content and "s3" in content.lower():
+                    trail_criteria.append("S3 data events enabled for artifacts bucket")
 
-            if "kms_key_id" in content:
-                trail_criteria.append("Logs written to Object Lock protected bucket")
+                if "kms_key_id" in content:
+                    trail_criteria.append("Logs written to Object Lock protected bucket")
 
-            if trail_criteria:
-                completions["Configure CloudTrail Logging"] = trail_criteria
+                trail_completions = {}
+                if trail_criteria:
+                    trail_completions["Configure CloudTrail Logging"] = trail_criteria
+                cached = self._remember_result(cloudtrail_file, trail_completions)
+            completions.update(cached)
 
         # Task: Implement Secrets Management
         app_dir = self.repo_root / "app"
@@ -260,38 +370,59 @@ class TaskAutoUpdater:
 
     def update_task_file(self, completions: dict[str, list[str]]) -> bool:
         """Update TASK.md with completed criteria."""
+        # Reason: checked first because the fingerprint stats TASK.md
         if not self.task_file.exists():
             print(f"ERROR: {self.task_file} not found")
             return False
 
+        # Skip when there is nothing to apply, or the same completions were already
+        # applied to an untouched TASK.md
+        if (
+            completions
+            and self._cache.get("task_file") != self._task_file_fingerprint(completions)
+            and self._apply_completions(completions)
+        ):
+            print(f"✅ Updated TASK.md with {len(completions)} completed tasks")
+            return True
+
+        print("ℹ️  No new completions detected")
+        return False
+
+    def _apply_completions(self, completions: dict[str, list[str]]) -> bool:
+        """Check off completed criteria in TASK.md and return whether it changed."""
         content = self.task_file.read_text()
         updated = False
 
-        # Get current PR number if in CI
-        pr_ref = self._get_pr_reference()
-
         for task_name, completed_criteria in completions.items():
             content, task_updated = self._update_task_section(
-                content, task_name, completed_criteria, pr_ref
+                content, task_name, completed_criteria
             )
             if task_updated:
                 updated = True
 
         if updated:
             self.task_file.write_text(content)
-            print(f"✅ Updated TASK.md with {len(completions)} completed tasks")
-            return True
-        else:
-            print("ℹ️  No new completions detected")
-            return False
+
+        self._cache["task_file"] = self._task_file_fingerprint(completions)
+        self._cache_dirty = True
+        self._save_cache()
+
+        return updated
+
+    def _task_file_fingerprint(self, completions: dict[str, list[str]]) -> dict[str, str | int]:
+        """Fingerprint the completions together with the current TASK.md mtime."""
+        payload = json.dumps(completions, sort_keys=True).encode()
+        return {
+            "completions_sha256": hashlib.sha256(payload).hexdigest(),
+            "mtime_ns": self.task_file.stat().st_mtime_ns,
+        }
 
     def _update_task_section(
-        self, content: str, task_name: str, completed_criteria: list[str], pr_ref: str
+        self, content: str, task_name: str, completed_criteria: list[str]
     ) -> tuple[str, bool]:
         """Update a specific task section in TASK.md."""
         # Find task section
-        task_pattern = rf"### Task: {re.escape(task_name)}.*?(?=### Task:|$)"
-        task_match = re.search(task_pattern, content, re.DOTALL)
+        task_match = self._task_pattern(task_name).search(content)
 
         if not task_match:
             print(f"⚠️  Task '{task_name}' not found in TASK.md")
@@ -303,10 +434,10 @@ class TaskAutoUpdater:
 
         # Check off completed criteria
         for criterion in completed_criteria:
-            # Look for unchecked criterion
-            criterion_pattern = rf"- \[ \] {re.escape(criterion)}"
-            if re.search(criterion_pattern, updated_section):
-                updated_section = re.sub(criterion_pattern, f"- [x] {criterion}", updated_section)
+            # Look for unchecked criterion (plain substring, no regex needed)
+            unchecked = f"- [ ] {criterion}"
+            if unchecked in updated_section:
+                updated_section = updated_section.replace(unchecked, f"- [x] {criterion}")
                 section_updated = True
 
         # Update status if all criteria are now checked
@@ -314,12 +445,18 @@ class TaskAutoUpdater:
             # Update status to COMPLETED
             if "**Status**: PENDING" in updated_section:
                 completion_date = datetime.now().strftime("%Y-%m-%d")
-                new_status = f"**Status**: COMPLETED ✅\n**Completed**: {completion_date}, {pr_ref}"
+                new_status = (
+                    f"**Status**: COMPLETED ✅\n**Completed**: {completion_date}, "
+                    f"{self._pr_reference}"
+                )
                 updated_section = updated_section.replace("**Status**: PENDING", new_status)
                 section_updated = True
             elif "**Status**: IN_PROGRESS" in updated_section:
                 completion_date = datetime.now().strftime("%Y-%m-%d")
-                new_status = f"**Status**: COMPLETED ✅\n**Completed**: {completion_date}, {pr_ref}"
+                new_status = (
+                    f"**Status**: COMPLETED ✅\n**Completed**: {completion_date}, "
+                    f"{self._pr_reference}"
+                )
                 updated_section = updated_section.replace("**Status**: IN_PROGRESS", new_status)
                 section_updated = True
 
@@ -328,39 +465,67 @@ class TaskAutoUpdater:
 
         return content, section_updated
 
+    def _task_pattern(self, task_name: str) -> re.Pattern[str]:
+        """Get the compiled section pattern for a task, escaping its name only once."""
+        pattern = self._task_patterns.get(task_name)
+        if pattern is None:
+            pattern = re.compile(rf"### Task: {re.escape(task_name)}.*?(?=### Task:|$)", re.DOTALL)
+            self._task_patterns[task_name] = pattern
+        return pattern
+
     def _all_criteria_completed(self, task_section: str) -> bool:
         """Check if all acceptance criteria in a task are completed."""
-        # Count total criteria
-        total_criteria = len(re.findall(r"- \[[x ]\]", task_section))
-        # Count completed criteria
-        completed_criteria = len(re.findall(r"- \[x\]", task_section))
+        completed_criteria = task_section.count("- [x]")
+        pending_criteria = task_section.count("- [ ]")
 
-        return total_criteria > 0 and total_criteria == completed_criteria
+        return completed_criteria > 0 and pending_criteria == 0
 
-    def _get_pr_reference(self) -> str:
-        """Get PR reference for completion tracking."""
+    @cached_property
+    def _pr_reference(self) -> str:
+        """PR reference for completion tracking, resolved once per run."""
         # Try to get from GitHub Actions environment
         pr_number = os.environ.get("GITHUB_PR_NUMBER")
         if pr_number:
             return f"PR #{pr_number}"
 
         # Try to get from git branch
+        branch = os.environ.get("GIT_BRANCH") or self._current_branch()
+        if branch and (branch.startswith("feature/") or branch.startswith("fix/")):
+            return f"Branch: {branch}"
+
+        return "Auto-detected"
+
+    def _current_branch(self) -> str | None:
+        """Get the current git branch, reading .git/HEAD before falling back to git."""
+        for directory in (self.repo_root, *self.repo_root.resolve().parents):
+            git_path = directory / ".git"
+            if not git_path.exists():
+                continue
+            # Reason: in worktrees and submodules .git is a file, so let git resolve HEAD
+            if git_path.is_dir():
+                try:
+                    head = (git_path / "HEAD").read_text().strip()
+                except OSError:
+                    break
+                if head.startswith("ref: refs/heads/"):
+                    return head.removeprefix("ref: refs/heads/")
+            break
+
+        # Detached HEAD, worktree or submodule
         try:
             result = subprocess.run(
-                ["git", "branch", "--show-current"],
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
                 capture_output=True,
                 text=True,
                 cwd=self.repo_root,
                 check=False,
             )
             if result.returncode == 0:
-                branch = result.stdout.strip()
-                if branch.startswith("feature/") or branch.startswith("fix/"):
-                    return f"Branch: {branch}"
+                return result.stdout.strip()
         except (subprocess.SubprocessError, OSError):
             pass
 
-        return "Auto-detected"
+        return None
 
 
 def main():
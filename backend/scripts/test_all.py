@@ -35,29 +35,69 @@ Examples:
     # Run tests with debug output
     python scripts/test_all.py --debug
 
-    # Generate detailed report for CI
-    python scripts/test_all.py --detailed-report
+    # Run pytest on a fixed number of xdist workers (0 disables xdist)
+    python scripts/test_all.py --jobs 4
+
+    # Run pytest in-process to skip interpreter startup
+    python scripts/test_all.py --jobs 0 --in-process
+
+    # Generate detailed report for CI (ignoring cached results)
+    python scripts/test_all.py --detailed-report --no-cache
     ./scripts/test ci
 """
 
 import argparse
+import asyncio
+import contextlib
+import errno
+import hashlib
+import heapq
+import io
 import json
 import logging
 import os
+import select
+import shutil
+import socket
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
+from xml.etree import ElementTree
 
 import httpx
+import orjson
 
 # Add the app directory to the Python path
 PROJECT_ROOT = Path(__file__).parent.parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+from tests._env import TEST_AWS_CREDENTIALS, TEST_ENV  # noqa: E402
+
+# Runs `ruff check` and `ruff format --check` from one process; fails if either fails
+RUFF_CHECKS_SCRIPT = """
+import subprocess, sys
+from ruff.__main__ import find_ruff_bin
+ruff = find_ruff_bin()
+paths = ["app/", "tests/"]
+codes = [subprocess.call([ruff, *args, *paths]) for args in (["check"], ["format", "--check"])]
+sys.exit(max(codes))
+"""
+
+# Reason: subprocess already spawns without fork() here (no preexec_fn, shell or
+# user/group switches), so CPython uses vfork/posix_spawn instead of copying this
+# process's page tables. Our own pipes are O_CLOEXEC, so on Linux the per-spawn scan
+# that closes every other inherited fd can be skipped too.
+SPAWN_KWARGS: dict[str, Any] = {"close_fds": False} if sys.platform == "linux" else {}
+
+# Cache directory for results reused across runs
+CACHE_DIR = PROJECT_ROOT / ".cache" / "test_all"
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -66,6 +106,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Per-result lines skip the asctime formatting (localtime + strftime per record)
+result_logger = logging.getLogger("test_all.result")
+_result_handler = logging.StreamHandler()
+_result_handler.setFormatter(logging.Formatter("%(message)s"))
+result_logger.addHandler(_result_handler)
+result_logger.propagate = False
+
 
 @dataclass
 class TestResult:
@@ -93,9 +140,11 @@ class TestReport:
     def add_result(self, result: TestResult) -> None:
         """Add a test result."""
         self.results.append(result)
-        logger.info(f"{'✅' if result.success else '❌'} {result.name} ({result.duration:.2f}s)")
+        result_logger.info(
+            f"{'✅' if result.success else '❌'} {result.name} ({result.duration:.2f}s)"
+        )
         if result.error and not result.success:
-            logger.error(f"  Error: {result.error}")
+            result_logger.error(f"  Error: {result.error}")
 
     def finalize(self) -> None:
         """Finalize the report."""
@@ -146,26 +195,16 @@ class TestReport:
     def save_json_report(self, filepath: Path) -> None:
         """Save detailed JSON report."""
         report_data = {
-            "start_time": self.start_time.isoformat(),
-            "end_time": self.end_time.isoformat() if self.end_time else None,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
             "total_duration": self.total_duration,
             "environment": self.environment,
             "summary": self.summary,
-            "results": [
-                {
-                    "name": r.name,
-                    "success": r.success,
-                    "duration": r.duration,
-                    "output": r.output,
-                    "error": r.error,
-                    "details": r.details,
-                }
-                for r in self.results
-            ],
+            # Reason: orjson serializes the TestResult dataclasses directly
+            "results": self.results,
         }
 
-        with open(filepath, "w") as f:
-            json.dump(report_data, f, indent=2)
+        filepath.write_bytes(orjson.dumps(report_data, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Detailed report saved to: {filepath}")
 
@@ -177,23 +216,39 @@ class TestRunner:
         self.args = args
         self.report = TestReport(start_time=datetime.now())
         self.setup_environment()
+        self.venv_python = self._resolve_venv_python()
+        self.route_paths: set[str] = set()
+
+    def _resolve_venv_python(self) -> str | None:
+        """Resolve the project's virtualenv interpreter once so later stages skip `uv run`."""
+        try:
+            output = subprocess.check_output(
+                ["uv", "run", "python", "-c", "import sys; print(sys.executable)"],
+                cwd=PROJECT_ROOT,
+                text=True,
+                stderr=subprocess.DEVNULL,
+            )
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            logger.warning("Could not resolve the uv environment; falling back to `uv run`")
+            return None
+        return output.strip() or None
+
+    def _resolve_command(self, cmd: list[str]) -> list[str]:
+        """Rewrite `uv run <tool> ...` to `<venv python> -m <tool> ...` when possible."""
+        if self.venv_python and cmd[:2] == ["uv", "run"]:
+            if cmd[2] == "python":
+                return [self.venv_python, *cmd[3:]]
+            return [self.venv_python, "-m", *cmd[2:]]
+        return cmd
 
     def setup_environment(self) -> None:
         """Setup test environment and validate prerequisites."""
         logger.info("Setting up test environment...")
 
-        # Set test environment variables
-        os.environ["APP_ENV"] = "test"
-        os.environ["AWS_REGION"] = "us-east-1"
-        os.environ["S3_BUCKET_ARTIFACTS"] = "test-artifacts-bucket"
-        os.environ["KMS_KEY_ARN"] = "arn:aws:kms:us-east-1:123456789012:key/test-key"
-        os.environ["DDB_TABLE_SCHEDULES"] = "test-schedules"
-        os.environ["DDB_TABLE_CAPTURES"] = "test-captures"
-
-        # Mock AWS credentials
-        os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-        os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-        os.environ["AWS_DEFAULT_REGION"] = "us-east-1"
+        # Set test environment variables and mock AWS credentials (same values as conftest.py)
+        os.environ.update(
+            {**TEST_ENV, **TEST_AWS_CREDENTIALS, "AWS_DEFAULT_REGION": TEST_ENV["AWS_REGION"]}
+        )
 
         # Store environment info
         self.report.environment = {
@@ -204,36 +259,53 @@ class TestRunner:
             "aws_region": os.environ.get("AWS_REGION", "unknown"),
         }
 
-    def run_command(
+    def _run_command_sync(
         self, cmd: list[str], name: str, cwd: Path | None = None, timeout: int = 300
     ) -> TestResult:
         """Run a command and return test result."""
         start_time = time.time()
+        cmd = self._resolve_command(cmd)
 
         try:
             logger.info(f"Running: {name}")
             if self.args.debug:
                 logger.debug(f"Command: {' '.join(cmd)}")
 
-            result = subprocess.run(
+            # Stream combined output so only a bounded tail stays in memory
+            tail: deque[str] = deque(maxlen=self.args.tail_lines)
+            proc = subprocess.Popen(
                 cmd,
                 cwd=cwd or PROJECT_ROOT,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=timeout,
-                check=False,
+                bufsize=1,
+                **SPAWN_KWARGS,
             )
+            reader = threading.Thread(
+                target=self._drain_output, args=(proc, tail), name=f"drain-{name}", daemon=True
+            )
+            reader.start()
+            try:
+                returncode = proc.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                reader.join()
 
             duration = time.time() - start_time
-            success = result.returncode == 0
+            success = returncode == 0
+            output = "\n".join(tail)
 
             return TestResult(
                 name=name,
                 success=success,
                 duration=duration,
-                output=result.stdout,
-                error=result.stderr if not success else "",
-                details={"returncode": result.returncode, "command": " ".join(cmd)},
+                output=output,
+                error="\n".join(list(tail)[-20:]) if not success else "",
+                details={"returncode": returncode, "command": " ".join(cmd)},
             )
 
         except subprocess.TimeoutExpired:
@@ -248,15 +320,121 @@ class TestRunner:
             duration = time.time() - start_time
             return TestResult(name=name, success=False, duration=duration, error=str(e))
 
+    def _drain_output(self, proc: subprocess.Popen[str], tail: deque[str]) -> None:
+        """Read a process's output line by line into a bounded tail buffer."""
+        if proc.stdout is None:
+            return
+        for line in proc.stdout:
+            tail.append(line.rstrip("\n"))
+            if self.args.debug:
+                sys.stderr.write(line)
+        proc.stdout.close()
+
+    async def run_command_async(
+        self, cmd: list[str], name: str, cwd: Path | None = None, timeout: int = 300
+    ) -> TestResult:
+        """Run a command without blocking the event loop and return test result."""
+        start_time = time.time()
+        cmd = self._resolve_command(cmd)
+
+        try:
+            logger.info(f"Running: {name}")
+            if self.args.debug:
+                logger.debug(f"Command: {' '.join(cmd)}")
+
+            proc = await asyncio.create_subprocess_exec(
+                *cmd,
+                cwd=cwd or PROJECT_ROOT,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                **SPAWN_KWARGS,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+            except TimeoutError:
+                proc.kill()
+                await proc.wait()
+                raise
+
+            duration = time.time() - start_time
+            success = proc.returncode == 0
+
+            return TestResult(
+                name=name,
+                success=success,
+                duration=duration,
+                output=stdout.decode(errors="replace"),
+                error=stderr.decode(errors="replace") if not success else "",
+                details={"returncode": proc.returncode, "command": " ".join(cmd)},
+            )
+
+        except TimeoutError:
+            duration = time.time() - start_time
+            return TestResult(
+                name=name,
+                success=False,
+                duration=duration,
+                error=f"Command timed out after {timeout}s",
+            )
+        except Exception as e:
+            duration = time.time() - start_time
+            return TestResult(name=name, success=False, duration=duration, error=str(e))
+
+    @staticmethod
+    def _read_cache(cache_file: Path) -> dict[str, Any]:
+        """Load a JSON cache file, treating a missing or corrupt file as empty."""
+        try:
+            data = json.loads(cache_file.read_text())
+        except (OSError, ValueError):
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    @staticmethod
+    def _write_cache(cache_file: Path, data: dict[str, Any]) -> None:
+        """Atomically replace a JSON cache file."""
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(".tmp")
+        tmp_file.write_text(json.dumps(data))
+        os.replace(tmp_file, cache_file)
+
+    def _source_hash(self) -> str:
+        """Hash the sources, config and tool versions behind the ruff and mypy results."""
+        digest = hashlib.blake2b()
+        # mypy.ini overrides pyproject's mypy settings; uv.lock pins the tool versions
+        paths = [
+            PROJECT_ROOT / name
+            for name in ("pyproject.toml", "mypy.ini", "uv.lock", "scripts/test_all.py")
+            if (PROJECT_ROOT / name).exists()
+        ]
+        for pattern in ("app/**/*.py", "tests/**/*.py"):
+            paths.extend(sorted(PROJECT_ROOT.glob(pattern)))
+        for path in paths:
+            digest.update(str(path.relative_to(PROJECT_ROOT)).encode())
+            digest.update(path.read_bytes())
+        return digest.hexdigest()
+
+    def _environment_cache_key(self, required_files: list[Path]) -> str | None:
+        """Fingerprint the inputs of validate_environment, or None if they can't be stat'ed."""
+        uv_path = shutil.which("uv")
+        if uv_path is None:
+            return None
+
+        try:
+            key = {
+                "uv_mtime": os.stat(uv_path).st_mtime,
+                "py": sys.version,
+                "files": {str(p): p.stat().st_mtime for p in required_files},
+            }
+        except OSError:
+            return None
+
+        return hashlib.blake2b(json.dumps(key, sort_keys=True).encode()).hexdigest()
+
     def validate_environment(self) -> TestResult:
         """Validate environment setup."""
         start_time = time.time()
         errors = []
 
-        # Check Python version
-        if sys.version_info < (3, 12):
-            errors.append(f"Python 3.12+ required, got {sys.version}")
-
         # Check required files
         required_files = [
             PROJECT_ROOT / "pyproject.toml",
@@ -264,8 +442,33 @@ class TestRunner:
             PROJECT_ROOT / "tests" / "conftest.py",
         ]
 
+        # Reuse the last successful validation while uv, Python and the files are unchanged
+        cache_file = CACHE_DIR / "env.json"
+        cache_key = self._environment_cache_key(required_files)
+        if cache_key is not None and not (self.args.debug or self.args.no_cache):
+            if self._read_cache(cache_file).get("key") == cache_key:
+                return TestResult(
+                    name="Environment Validation",
+                    success=True,
+                    duration=time.time() - start_time,
+                    details={"checks": len(required_files) + 2, "errors": 0, "cached": True},
+                )
+
+        # Check Python version
+        if sys.version_info < (3, 12):
+            errors.append(f"Python 3.12+ required, got {sys.version}")
+
+        # One directory listing per parent instead of a stat per file
+        present_by_parent: dict[Path, set[str]] = {}
+        for parent in {file_path.parent for file_path in required_files}:
+            try:
+                with os.scandir(parent) as entries:
+                    present_by_parent[parent] = {entry.name for entry in entries}
+            except OSError:
+                present_by_parent[parent] = set()
+
         for file_path in required_files:
-            if not file_path.exists():
+            if file_path.name not in present_by_parent[file_path.parent]:
                 errors.append(f"Required file missing: {file_path}")
 
         # Check UV availability
@@ -277,6 +480,9 @@ class TestRunner:
         duration = time.time() - start_time
         success = len(errors) == 0
 
+        if success and cache_key is not None:
+            self._write_cache(cache_file, {"key": cache_key})
+
         return TestResult(
             name="Environment Validation",
             success=success,
@@ -296,10 +502,14 @@ class TestRunner:
                     "--cov=app",
                     "--cov-report=term-missing",
                     "--cov-report=html",
+                    "--cov-report=xml",
                     f"--cov-fail-under={self.args.coverage_threshold}",
                 ]
             )
 
+        # Distribute tests across CPU cores
+        cmd.extend(self._xdist_args())
+
         # Add verbosity
         if self.args.debug:
             cmd.extend(["-v", "-s", "--log-cli-level=DEBUG"])
@@ -314,30 +524,161 @@ class TestRunner:
         if not self.args.debug and not self.args.verbose:
             cmd.append("-q")
 
-        return self.run_command(cmd, "Unit Tests with Coverage")
+        cov_path = CACHE_DIR / "cov.json" if self.args.coverage_threshold > 0 else None
+        return self._run_pytest(
+            cmd, "Unit Tests with Coverage", CACHE_DIR / "pytest-unit.xml", cov_path
+        )
 
-    def run_code_quality_checks(self) -> list[TestResult]:
-        """Run code quality checks."""
-        results = []
+    def _run_pytest(
+        self, cmd: list[str], name: str, junit_path: Path, cov_path: Path | None = None
+    ) -> TestResult:
+        """Run pytest with structured reports and summarize them into the result details."""
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Remove stale reports so a crashed run can't be summarized from an older one
+        junit_path.unlink(missing_ok=True)
+        cmd = [*cmd, f"--junitxml={junit_path}"]
+        if cov_path is not None:
+            cov_path.unlink(missing_ok=True)
+            cmd.append(f"--cov-report=json:{cov_path}")
+
+        result = self._execute_pytest(cmd, name)
+        result.details.update(self._summarize_pytest_reports(junit_path, cov_path))
+
+        # The structured summary replaces the console log; keep the output tail only on failure
+        if result.success:
+            result.output = ""
+        return result
+
+    @staticmethod
+    def _summarize_pytest_reports(
+        junit_path: Path, cov_path: Path | None, slowest: int = 5
+    ) -> dict[str, Any]:
+        """Extract test counts, slowest tests and coverage from pytest's report files."""
+        summary: dict[str, Any] = {}
+
+        if junit_path.exists():
+            counts = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0}
+            durations: list[tuple[float, str]] = []
+            # Reason: iterparse streams the file; the XML is our own pytest output
+            for _, elem in ElementTree.iterparse(junit_path):  # noqa: S314
+                if elem.tag != "testcase":
+                    continue
+                counts["tests"] += 1
+                for outcome, key in (
+                    ("failure", "failures"),
+                    ("error", "errors"),
+                    ("skipped", "skipped"),
+                ):
+                    if elem.find(outcome) is not None:
+                        counts[key] += 1
+                test_id = f"{elem.get('classname', '')}::{elem.get('name', '')}"
+                durations.append((float(elem.get("time") or 0.0), test_id))
+                elem.clear()
+
+            summary["tests"] = counts
+            summary["slowest"] = [
+                {"test": test_id, "duration": duration}
+                for duration, test_id in heapq.nlargest(slowest, durations)
+            ]
+
+        if cov_path is not None and cov_path.exists():
+            totals = json.loads(cov_path.read_bytes()).get("totals", {})
+            summary["coverage_percent"] = totals.get("percent_covered")
+
+        return summary
+
+    def _execute_pytest(self, cmd: list[str], name: str) -> TestResult:
+        """Run a `uv run pytest ...` command, in-process when requested."""
+        if not self.args.in_process:
+            return self._run_command_sync(cmd, name)
+        if self.args.jobs != "0":
+            # Reason: xdist has to control its own controller process
+            logger.info(f"--in-process ignored for {name}: requires --jobs 0")
+            return self._run_command_sync(cmd, name)
+        if any(arg.startswith("--cov") for arg in cmd):
+            # Reason: the startup stage already imported app/, so pytest-cov would miss its
+            # module-level lines; coverage needs a fresh interpreter
+            logger.info(f"--in-process ignored for {name}: requires --coverage-threshold 0")
+            return self._run_command_sync(cmd, name)
+
+        import pytest  # Reason: only needed for in-process runs
 
-        if not self.args.skip_quality:
-            # Ruff linting
-            results.append(
-                self.run_command(["uv", "run", "ruff", "check", "app/", "tests/"], "Ruff Linting")
-            )
+        start_time = time.time()
+        buffer = io.StringIO()
+        try:
+            with (
+                contextlib.chdir(PROJECT_ROOT),
+                contextlib.redirect_stdout(buffer),
+                contextlib.redirect_stderr(buffer),
+            ):
+                returncode = int(pytest.main(cmd[3:]))
+        except Exception as e:
+            duration = time.time() - start_time
+            return TestResult(name=name, success=False, duration=duration, error=str(e))
 
-            # Ruff formatting check
-            results.append(
-                self.run_command(
-                    ["uv", "run", "ruff", "format", "--check", "app/", "tests/"],
-                    "Ruff Format Check",
-                )
-            )
+        duration = time.time() - start_time
+        success = returncode == 0
+        output = buffer.getvalue()
 
+        return TestResult(
+            name=name,
+            success=success,
+            duration=duration,
+            output=output,
+            error=output if not success else "",
+            details={"returncode": returncode, "command": " ".join(cmd), "in_process": True},
+        )
+
+    def _xdist_args(self) -> list[str]:
+        """Build pytest-xdist arguments for the configured number of workers."""
+        if self.args.jobs == "0":
+            # Reason: pyproject's addopts enable xdist, so turn it off explicitly
+            return ["-n", "0"]
+        # Reason: loadfile keeps each test file (and its moto state) on one worker
+        return ["-n", str(self.args.jobs), "--dist=loadfile"]
+
+    async def run_code_quality_checks(self) -> list[TestResult]:
+        """Run code quality checks concurrently, skipping tools whose sources are unchanged."""
+        if self.args.skip_quality:
+            return []
+
+        # Reuse the last success of each tool while app/ and tests/ are unchanged
+        cache_file = CACHE_DIR / "quality.json"
+        src_hash = self._source_hash()
+        cached = {} if self.args.no_cache else self._read_cache(cache_file)
+
+        async def run_tool(tool: str, cmd: list[str], name: str) -> TestResult:
+            if cached.get(tool) == src_hash:
+                return TestResult(name=name, success=True, duration=0.0, details={"cached": True})
+            return await self.run_command_async(cmd, name)
+
+        # Reason: ruff and mypy share no state, so their startup and runs can overlap
+        ruff_result, mypy_result = await asyncio.gather(
+            # Ruff linting and formatting check in a single interpreter
+            run_tool(
+                "ruff",
+                ["uv", "run", "python", "-c", RUFF_CHECKS_SCRIPT],
+                "Ruff Lint and Format Check",
+            ),
             # MyPy type checking
-            results.append(self.run_command(["uv", "run", "mypy", "app/"], "MyPy Type Checking"))
+            run_tool("mypy", ["uv", "run", "mypy", "app/"], "MyPy Type Checking"),
+        )
+
+        updated = {
+            tool: src_hash
+            for tool, result in (("ruff", ruff_result), ("mypy", mypy_result))
+            if result.success
+        }
+        if {**cached, **updated} != cached:
+            self._write_cache(cache_file, {**cached, **updated})
+
+        return [ruff_result, mypy_result]
 
-        return results
+    async def _run_preflight(self) -> tuple[TestResult, list[TestResult]]:
+        """Validate the environment while the code quality checks run."""
+        return await asyncio.gather(
+            asyncio.to_thread(self.validate_environment), self.run_code_quality_checks()
+        )
 
     def test_server_startup(self) -> TestResult:
         """Test FastAPI server startup."""
@@ -351,12 +692,9 @@ class TestRunner:
             if not hasattr(app, "routes") or len(app.routes) == 0:
                 raise Exception("FastAPI app has no routes configured")
 
-            # Test health endpoint availability
-            health_route_found = False
-            for route in app.routes:
-                if hasattr(route, "path") and "/health" in route.path:
-                    health_route_found = True
-                    break
+            # Test health endpoint availability (paths kept for reuse by later stages)
+            self.route_paths = {getattr(route, "path", "") for route in app.routes}
+            health_route_found = any(path.endswith("/health") for path in self.route_paths)
 
             if not health_route_found:
                 raise Exception("Health endpoint not found in routes")
@@ -378,6 +716,7 @@ class TestRunner:
     def run_integration_tests(self) -> TestResult:
         """Run integration tests."""
         cmd = ["uv", "run", "pytest", "tests/", "-m", "integration"]
+        cmd.extend(self._xdist_args())
 
         if self.args.debug:
             cmd.extend(["-v", "-s", "--log-cli-level=DEBUG"])
@@ -386,7 +725,20 @@ class TestRunner:
         else:
             cmd.append("-q")
 
-        return self.run_command(cmd, "Integration Tests")
+        return self._run_pytest(cmd, "Integration Tests", CACHE_DIR / "pytest-integration.xml")
+
+    @staticmethod
+    def _port_listening(host: str, port: int, timeout: float = 0.2) -> bool:
+        """Probe a TCP port with a non-blocking connect."""
+        with socket.socket() as probe:
+            probe.setblocking(False)
+            err = probe.connect_ex((host, port))
+            if err == errno.EINPROGRESS:
+                _, writable, _ = select.select([], [probe], [], timeout)
+                if not writable:
+                    return False
+                err = probe.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+            return err == 0
 
     def test_live_server(self) -> TestResult:
         """Test live server endpoints if available."""
@@ -395,7 +747,19 @@ class TestRunner:
         try:
             # Try to connect to local server
             base_url = "http://localhost:8000"
-            timeout = 5
+
+            # Fast-fail with one non-blocking connect when nothing listens on the port
+            if not self._port_listening("127.0.0.1", 8000):
+                return TestResult(
+                    name="Live Server Test",
+                    success=False,
+                    duration=time.time() - start_time,
+                    error="Server not running: port 8000 not listening "
+                    "(this is expected if no server is started)",
+                )
+
+            # Something is listening, so the request itself shouldn't need long
+            timeout = 1.0
 
             with httpx.Client(timeout=timeout) as client:
                 # Test health endpoint
@@ -442,11 +806,10 @@ class TestRunner:
         if self.args.skip_quality:
             logger.info("Skipping code quality checks")
 
-        # 1. Environment validation
-        self.report.add_result(self.validate_environment())
-
-        # 2. Code quality checks
-        for result in self.run_code_quality_checks():
+        # 1-2. Environment validation and code quality checks (run concurrently)
+        env_result, quality_results = asyncio.run(self._run_preflight())
+        self.report.add_result(env_result)
+        for result in quality_results:
             self.report.add_result(result)
 
         # 3. FastAPI server startup test
@@ -510,6 +873,12 @@ def main():
         "--skip-quality", action="store_true", help="Skip code quality checks (ruff, mypy)"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore cached environment and code quality results (use in CI)",
+    )
+
     # Coverage options
     parser.add_argument(
         "--coverage-threshold",
@@ -518,7 +887,29 @@ def main():
         help="Minimum coverage percentage required (default: 90)",
     )
 
+    # Parallelism options
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        default="auto",
+        help="Number of pytest-xdist workers, 'auto' for one per CPU or 0 to disable "
+        "(default: auto)",
+    )
+
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="Run pytest inside this process instead of a subprocess (requires --jobs 0)",
+    )
+
     # Output options
+    parser.add_argument(
+        "--tail-lines",
+        type=int,
+        default=1000,
+        help="Lines of command output kept per stage in results (default: 1000)",
+    )
+
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     parser.add_argument("--debug", action="store_true", help="Debug mode with detailed output")
@@ -0,0 +1,22 @@
+"""Environment shared by the pytest suite and scripts/test_all.py."""
+
+from __future__ import annotations
+
+# Applied in one os.environ.update() before app settings are first read; don't interleave
+# reads of these keys with partial updates.
+TEST_ENV: dict[str, str] = {
+    "APP_ENV": "test",
+    "AWS_REGION": "us-east-1",
+    "S3_BUCKET_ARTIFACTS": "test-artifacts-bucket",
+    "KMS_KEY_ARN": "arn:aws:kms:us-east-1:123456789012:key/test-key",
+    "DDB_TABLE_SCHEDULES": "test-schedules",
+    "DDB_TABLE_CAPTURES": "test-captures",
+}
+
+# Fake credentials that keep boto3 from ever reaching real AWS.
+TEST_AWS_CREDENTIALS: dict[str, str] = {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_SECURITY_TOKEN": "testing",
+    "AWS_SESSION_TOKEN": "testing",
+}
@@ -0,0 +1,63 @@
+"""Shared helpers and stubs for storage and API tests."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import Any
+
+import httpx
+import orjson
+
+from app.core.config import settings
+from app.storage.dynamo import (
+    CaptureData,
+    ScheduleData,
+    capture_item,
+    schedule_item,
+    table,
+)
+
+
+def bulk_create_captures(captures: Iterable[CaptureData]) -> None:
+    """Write capture records in a single batch, using the same items as create_capture."""
+    with table(settings.ddb_table_captures).batch_writer() as batch:
+        for data in captures:
+            batch.put_item(Item=capture_item(data))
+
+
+def bulk_create_schedules(schedules: Iterable[ScheduleData]) -> None:
+    """Write schedule records in a single batch, using the same items as create_schedule."""
+    with table(settings.ddb_table_schedules).batch_writer() as batch:
+        for data in schedules:
+            batch.put_item(Item=schedule_item(data))
+
+
+def jloads(response: httpx.Response) -> Any:
+    """Decode a response body with orjson instead of the stdlib json decoder."""
+    return orjson.loads(response.content)
+
+
+class Stub:
+    """Callable test double that records calls and returns a fixed value.
+
+    A cheaper stand-in for MagicMock where only the return value and call list matter.
+    """
+
+    __slots__ = ("calls", "return_value", "side_effect")
+
+    def __init__(self, return_value: Any = None) -> None:
+        self.return_value = return_value
+        self.side_effect: BaseException | None = None
+        self.calls: list[tuple[tuple[Any, ...], dict[str, Any]]] = []
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
+    def reset(self) -> None:
+        """Forget recorded calls and configured behaviour."""
+        self.return_value = None
+        self.side_effect = None
+        self.calls.clear()
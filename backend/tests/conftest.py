@@ -3,184 +3,334 @@
 from __future__ import annotations
 
 import os
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator, Mapping
+from types import MappingProxyType
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
+import httpx
 import pytest
+import pytest_asyncio
 from moto import mock_aws
 
+from tests._env import TEST_AWS_CREDENTIALS, TEST_ENV
+
 # Set test environment
-os.environ["APP_ENV"] = "test"
-os.environ["AWS_REGION"] = "us-east-1"
-os.environ["S3_BUCKET_ARTIFACTS"] = "test-artifacts-bucket"
-os.environ["KMS_KEY_ARN"] = "arn:aws:kms:us-east-1:123456789012:key/test-key"
-os.environ["DDB_TABLE_SCHEDULES"] = "test-schedules"
-os.environ["DDB_TABLE_CAPTURES"] = "test-captures"
+os.environ.update(TEST_ENV)
 
 
 @pytest.fixture
 def mock_aws_credentials() -> None:
     """Mock AWS credentials to prevent accidental real AWS calls."""
-    os.environ["AWS_ACCESS_KEY_ID"] = "testing"
-    os.environ["AWS_SECRET_ACCESS_KEY"] = "testing"
-    os.environ["AWS_SECURITY_TOKEN"] = "testing"
-    os.environ["AWS_SESSION_TOKEN"] = "testing"
+    os.environ.update(TEST_AWS_CREDENTIALS)
 
 
-@pytest.fixture
-def mock_s3_bucket(mock_aws_credentials: None) -> Generator[str, None, None]:
-    """Create a mock S3 bucket for testing."""
+@pytest.fixture(scope="session")
+def _moto_env() -> Generator[None, None, None]:
+    """Start moto once per test session for every fixture that needs mocked AWS.
+
+    moto keeps its state in process memory, so each pytest-xdist worker gets its own
+    backend; fixed resource names (buckets, tables) can't collide across workers.
+    """
+    # Reason: function-scoped mock_aws_credentials can't be used from a session fixture.
+    os.environ.update(TEST_AWS_CREDENTIALS)
+
     with mock_aws():
-        import boto3
+        yield
+
+
+@pytest.fixture(scope="session")
+def s3_test_client(_moto_env: None) -> Any:
+    """One boto3 S3 client, shared by the session, for seeding and inspecting moto S3."""
+    import boto3
+
+    return boto3.client("s3", region_name="us-east-1")
+
+
+@pytest.fixture(scope="session")
+def mock_s3_bucket(s3_test_client: Any, _reset_s3_client_cache: None) -> str:
+    """Create the mock artifacts bucket, with versioning and Object Lock, once per session.
+
+    Tests write under their own keys instead of tearing the bucket down: Compliance-mode
+    locked versions can't be deleted, and moto discards everything when the session ends.
+    """
+    # The same name the app reads from S3_BUCKET_ARTIFACTS
+    bucket_name = TEST_ENV["S3_BUCKET_ARTIFACTS"]
+
+    # Object Lock implies versioning
+    s3_test_client.create_bucket(Bucket=bucket_name, ObjectLockEnabledForBucket=True)
+
+    return bucket_name
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _reset_s3_client_cache() -> Generator[None, None, None]:
+    """Drop the app's cached S3 client so it's created inside the session's moto context."""
+    # Reason: importing here also pays boto3's import once, before the first S3 test runs
+    from app.storage import s3
+
+    s3.s3_client.cache_clear()
+
+    yield
+
+    s3.s3_client.cache_clear()
 
-        s3_client = boto3.client("s3", region_name="us-east-1")
-        bucket_name = "test-artifacts-bucket"
 
-        # Create bucket with versioning and Object Lock
-        s3_client.create_bucket(Bucket=bucket_name)
-        s3_client.put_bucket_versioning(
-            Bucket=bucket_name, VersioningConfiguration={"Status": "Enabled"}
-        )
+def _create_dynamodb_tables() -> dict[str, Any]:
+    """Create the mock DynamoDB tables used by the storage tests."""
+    import boto3
 
-        yield bucket_name
+    dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
+
+    # Create schedules table
+    schedules_table = dynamodb.create_table(
+        TableName="test-schedules",
+        KeySchema=[{"AttributeName": "schedule_id", "KeyType": "HASH"}],
+        AttributeDefinitions=[
+            {"AttributeName": "schedule_id", "AttributeType": "S"},
+            {"AttributeName": "user_id", "AttributeType": "S"},
+            {"AttributeName": "next_capture_time", "AttributeType": "N"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "UserSchedulesIndex",
+                "KeySchema": [
+                    {"AttributeName": "user_id", "KeyType": "HASH"},
+                    {"AttributeName": "next_capture_time", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "NextCaptureIndex",
+                "KeySchema": [{"AttributeName": "next_capture_time", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+    # Create captures table
+    captures_table = dynamodb.create_table(
+        TableName="test-captures",
+        KeySchema=[
+            {"AttributeName": "capture_id", "KeyType": "HASH"},
+            {"AttributeName": "created_at", "KeyType": "RANGE"},
+        ],
+        AttributeDefinitions=[
+            {"AttributeName": "capture_id", "AttributeType": "S"},
+            {"AttributeName": "created_at", "AttributeType": "N"},
+            {"AttributeName": "user_id", "AttributeType": "S"},
+            {"AttributeName": "url", "AttributeType": "S"},
+            {"AttributeName": "sha256", "AttributeType": "S"},
+        ],
+        GlobalSecondaryIndexes=[
+            {
+                "IndexName": "UserCapturesIndex",
+                "KeySchema": [
+                    {"AttributeName": "user_id", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "UrlCapturesIndex",
+                "KeySchema": [
+                    {"AttributeName": "url", "KeyType": "HASH"},
+                    {"AttributeName": "created_at", "KeyType": "RANGE"},
+                ],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+            {
+                "IndexName": "HashIndex",
+                "KeySchema": [{"AttributeName": "sha256", "KeyType": "HASH"}],
+                "Projection": {"ProjectionType": "ALL"},
+            },
+        ],
+        BillingMode="PAY_PER_REQUEST",
+    )
+
+    return {
+        "schedules": schedules_table,
+        "captures": captures_table,
+    }
+
+
+@pytest.fixture(scope="session")
+def _dynamodb_session_tables(_moto_env: None) -> Generator[dict[str, Any], None, None]:
+    """Create the mock DynamoDB tables once per test session."""
+    from app.storage import dynamo
+
+    # Reason: app code caches its resource/table handles; start from fresh ones.
+    dynamo.table.cache_clear()
+    dynamo.ddb.cache_clear()
+
+    yield _create_dynamodb_tables()
+
+    dynamo.table.cache_clear()
+    dynamo.ddb.cache_clear()
+
+
+def _truncate_table(table: Any) -> None:
+    """Delete every item from a table, keeping its schema and indexes."""
+    key_names = [key["AttributeName"] for key in table.key_schema]
+    scan_kwargs: dict[str, Any] = {"ProjectionExpression": ", ".join(key_names)}
+    with table.batch_writer() as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            for item in response.get("Items", []):
+                batch.delete_item(Key={name: item[name] for name in key_names})
+            if "LastEvaluatedKey" not in response:
+                break
+            scan_kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
 
 
 @pytest.fixture
-def mock_dynamodb_tables(mock_aws_credentials: None) -> Generator[dict[str, Any], None, None]:
-    """Create mock DynamoDB tables for testing."""
-    with mock_aws():
-        import boto3
-
-        dynamodb = boto3.resource("dynamodb", region_name="us-east-1")
-
-        # Create schedules table
-        schedules_table = dynamodb.create_table(
-            TableName="test-schedules",
-            KeySchema=[{"AttributeName": "schedule_id", "KeyType": "HASH"}],
-            AttributeDefinitions=[
-                {"AttributeName": "schedule_id", "AttributeType": "S"},
-                {"AttributeName": "user_id", "AttributeType": "S"},
-                {"AttributeName": "next_capture_time", "AttributeType": "N"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "UserSchedulesIndex",
-                    "KeySchema": [
-                        {"AttributeName": "user_id", "KeyType": "HASH"},
-                        {"AttributeName": "next_capture_time", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-                {
-                    "IndexName": "NextCaptureIndex",
-                    "KeySchema": [{"AttributeName": "next_capture_time", "KeyType": "HASH"}],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-            ],
-            BillingMode="PAY_PER_REQUEST",
-        )
-
-        # Create captures table
-        captures_table = dynamodb.create_table(
-            TableName="test-captures",
-            KeySchema=[
-                {"AttributeName": "capture_id", "KeyType": "HASH"},
-                {"AttributeName": "created_at", "KeyType": "RANGE"},
-            ],
-            AttributeDefinitions=[
-                {"AttributeName": "capture_id", "AttributeType": "S"},
-                {"AttributeName": "created_at", "AttributeType": "N"},
-                {"AttributeName": "user_id", "AttributeType": "S"},
-                {"AttributeName": "url", "AttributeType": "S"},
-                {"AttributeName": "sha256", "AttributeType": "S"},
-            ],
-            GlobalSecondaryIndexes=[
-                {
-                    "IndexName": "UserCapturesIndex",
-                    "KeySchema": [
-                        {"AttributeName": "user_id", "KeyType": "HASH"},
-                        {"AttributeName": "created_at", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-                {
-                    "IndexName": "UrlCapturesIndex",
-                    "KeySchema": [
-                        {"AttributeName": "url", "KeyType": "HASH"},
-                        {"AttributeName": "created_at", "KeyType": "RANGE"},
-                    ],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-                {
-                    "IndexName": "HashIndex",
-                    "KeySchema": [{"AttributeName": "sha256", "KeyType": "HASH"}],
-                    "Projection": {"ProjectionType": "ALL"},
-                },
-            ],
-            BillingMode="PAY_PER_REQUEST",
-        )
-
-        yield {
-            "schedules": schedules_table,
-            "captures": captures_table,
-        }
+def mock_dynamodb_tables(
+    request: pytest.FixtureRequest,
+    _dynamodb_session_tables: dict[str, Any],
+) -> Generator[dict[str, Any], None, None]:
+    """Provide the mock DynamoDB tables, emptied again after each test.
+
+    Tests marked ``ddb_schema_change`` get the tables dropped and recreated instead.
+    """
+    yield _dynamodb_session_tables
+
+    if request.node.get_closest_marker("ddb_schema_change"):
+        from app.storage import dynamo
+
+        for table in _dynamodb_session_tables.values():
+            table.delete()
+        dynamo.table.cache_clear()
+        _dynamodb_session_tables.update(_create_dynamodb_tables())
+        return
+
+    for table in _dynamodb_session_tables.values():
+        _truncate_table(table)
+
+
+def _build_playwright_mocks() -> dict[str, Any]:
+    """Build the mock Playwright object graph shared by every mock_playwright use."""
+    mock = MagicMock()
+
+    # Setup mock browser behavior (plain Mock: no magic-method protocol is needed)
+    mock_page = Mock()
+    mock_page.pdf = AsyncMock()
+    mock_page.screenshot = AsyncMock()
+    mock_page.goto = AsyncMock()
+    mock_page.wait_for_timeout = AsyncMock()
+
+    mock_context = Mock()
+    mock_context.new_page = AsyncMock()
+    mock_context.close = AsyncMock()
+
+    mock_browser = Mock()
+    mock_browser.new_context = AsyncMock()
+    mock_browser.close = AsyncMock()
+
+    mock_playwright_instance = Mock()
+    mock_playwright_instance.chromium.launch = AsyncMock()
+
+    # Create an async context manager (MagicMock provides AsyncMock __aenter__/__aexit__)
+    mock.return_value.__aenter__.return_value = mock_playwright_instance
+    mock.return_value.__aexit__.return_value = None
+
+    return {
+        "mock": mock,
+        "playwright_instance": mock_playwright_instance,
+        "browser": mock_browser,
+        "context": mock_context,
+        "page": mock_page,
+    }
+
+
+# Reason: constructing the (Async)Mock graph dominates fixture cost; build it once and
+# reset it per test. copy.copy() would share child mocks, so it isn't used here.
+_PLAYWRIGHT_MOCKS = _build_playwright_mocks()
 
 
 @pytest.fixture
 def mock_playwright() -> Generator[dict[str, Any], None, None]:
     """Mock Playwright for testing without launching actual browser."""
-    with patch("app.capture_engine.engine.async_playwright") as mock:
-        # Setup mock browser behavior
-        mock_page = MagicMock()
-        mock_page.pdf = AsyncMock(return_value=b"fake_pdf_content")
-        mock_page.screenshot = AsyncMock(return_value=b"fake_png_content")
-        mock_page.goto = AsyncMock()
-        mock_page.wait_for_timeout = AsyncMock()
+    mocks = _PLAYWRIGHT_MOCKS
+    for mock in mocks.values():
+        mock.reset_mock(side_effect=True)
 
-        mock_context = MagicMock()
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-        mock_context.close = AsyncMock()
+    # Re-apply the wiring in case a previous test overrode a return value
+    mocks["page"].pdf.return_value = b"fake_pdf_content"
+    mocks["page"].screenshot.return_value = b"fake_png_content"
+    mocks["context"].new_page.return_value = mocks["page"]
+    mocks["browser"].new_context.return_value = mocks["context"]
+    mocks["playwright_instance"].chromium.launch.return_value = mocks["browser"]
+    mocks["mock"].return_value.__aenter__.return_value = mocks["playwright_instance"]
 
-        mock_browser = MagicMock()
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_browser.close = AsyncMock()
+    with patch("app.capture_engine.engine.async_playwright", new=mocks["mock"]):
+        # Return access to mock objects for assertions
+        yield mocks
 
-        mock_playwright_instance = MagicMock()
-        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
 
-        # Create an async context manager
-        async def aenter(self):
-            return mock_playwright_instance
+@pytest.fixture(scope="session", autouse=True)
+def _warm_auth() -> Generator[None, None, None]:
+    """Import the auth stack up front and keep JWKS lookups off the network."""
+    from app.auth import deps
 
-        async def aexit(self, *args):
-            return None
+    saved = dict(deps._jwks_cache)
+    # Reason: a cached, never-expiring empty key set makes get_jwks() skip the HTTP fetch
+    deps._jwks_cache.update(data={"keys": []}, expires_at=float("inf"))
 
-        mock.return_value.__aenter__ = aenter
-        mock.return_value.__aexit__ = aexit
+    yield
 
-        # Return access to mock objects for assertions
-        yield {
-            "mock": mock,
-            "playwright_instance": mock_playwright_instance,
-            "browser": mock_browser,
-            "context": mock_context,
-            "page": mock_page,
-        }
+    deps._jwks_cache.update(saved)
 
 
-@pytest.fixture
-def sample_capture_data() -> dict[str, Any]:
-    """Sample capture data for testing."""
-    return {
-        "capture_id": "test-capture-123",
-        "url": "https://example.com",
-        "artifact_type": "pdf",
-        "user_id": "test-user",
-        "sha256": "abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234",
-        "s3_key": "captures/test-capture-123.pdf",
-        "metadata": {"test": "value"},
-    }
+# Middleware that only shapes browser-facing responses; no test asserts on it
+_STRIPPED_MIDDLEWARE = frozenset({"CORSMiddleware", "GZipMiddleware"})
+
+
+@pytest.fixture(scope="session")
+def _slim_middleware() -> Generator[None, None, None]:
+    """Strip CORS/GZip middleware from the app so each request runs a shorter stack."""
+    from app.main import app
+
+    original = app.user_middleware
+    app.user_middleware = [m for m in original if m.cls.__name__ not in _STRIPPED_MIDDLEWARE]
+    # Reason: Starlette builds the stack lazily on the next request once this is None
+    app.middleware_stack = None
+
+    yield
+
+    app.user_middleware = original
+    app.middleware_stack = None
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def aclient(_slim_middleware: None) -> AsyncGenerator[httpx.AsyncClient, None]:
+    """In-process ASGI client shared by the whole session (no TestClient worker thread).
+
+    Unhandled app errors come back as 500 responses instead of being re-raised.
+    """
+    from app.main import app
+
+    # Reason: ASGITransport calls the app directly with no connection pool, so httpx.Limits
+    # keep-alive tuning would be a no-op; sharing this one transport is the whole saving.
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_capture_data() -> Mapping[str, Any]:
+    """Sample capture data for testing (read-only, shared across the session)."""
+    return MappingProxyType(
+        {
+            "capture_id": "test-capture-123",
+            "url": "https://example.com",
+            "artifact_type": "pdf",
+            "user_id": "test-user",
+            "sha256": "abcd1234567890abcd1234567890abcd1234567890abcd1234567890abcd1234",
+            "s3_key": "captures/test-capture-123.pdf",
+            "metadata": {"test": "value"},
+        }
+    )
 
 
 @pytest.fixture
@@ -2,261 +2,338 @@
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock, patch
+from collections.abc import AsyncGenerator, Awaitable, Generator
+from types import MappingProxyType, SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
-from fastapi.testclient import TestClient
+import pytest_asyncio
+from fastapi import HTTPException
+from pydantic import BaseModel
 
+from app.api.routes import captures as captures_routes
+from app.api.routes.captures import download_capture, get_capture_by_id, list_captures
 from app.auth.deps import require_operator, require_viewer
+from app.capture_engine import processor
 from app.main import app
+from app.storage import dynamo, s3
+from tests._helpers import Stub, jloads
+
+# Reason: the session-scoped clients and the tests have to share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+_MOCK_USER = {
+    "sub": "test-user-123",
+    "email": "test@example.com",
+    "role": "operator",
+}
+
+
+# Fields shared by the mocked capture records; tests spread it and override what differs
+BASE_CAPTURE = MappingProxyType(
+    {
+        "user_id": "test-user-123",
+        "sha256": "test-hash",
+        "s3_key": "test-key",
+        "artifact_type": "pdf",
+        "url": "https://example.com",
+        "created_at": 1234567890.0,
+        "status": "completed",
+    }
+)
 
+# Older records predate the status field; the API should fill in "completed"
+BASE_CAPTURE_NO_STATUS = MappingProxyType(
+    {key: value for key, value in BASE_CAPTURE.items() if key != "status"}
+)
 
-@pytest.fixture
-def mock_auth_user() -> dict[str, str]:
-    """Mock authenticated user."""
-    return {
-        "sub": "test-user-123",
-        "email": "test@example.com",
-        "role": "operator",
-    }
 
+def _override() -> dict[str, str]:
+    """Return the mock authenticated user for the auth dependencies."""
+    return _MOCK_USER
 
-@pytest.fixture
-def client(mock_auth_user: dict[str, str]) -> TestClient:
-    """Create test client with overridden dependencies."""
 
-    def override_require_viewer():
-        return mock_auth_user
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def client_strict() -> AsyncGenerator[httpx.AsyncClient, None]:
+    """Create an ASGI client that re-raises unhandled app errors, for 5xx tests."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as async_client:
+        yield async_client
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _override_deps() -> Generator[None, None, None]:
+    """Override the auth dependencies once for the module."""
+    added = []
+    for dep in (require_viewer, require_operator):
+        # Reason: never replace (and later drop) an override someone else installed
+        if dep not in app.dependency_overrides:
+            app.dependency_overrides[dep] = _override
+            added.append(dep)
+
+    yield
+
+    # Remove only our overrides, leaving any others in place
+    for dep in added:
+        app.dependency_overrides.pop(dep, None)
+
 
-    def override_require_operator():
-        return mock_auth_user
+# Reason: plain Stubs are far cheaper than MagicMock; share them and reset after each test
+_CAPTURES_MOCKS = SimpleNamespace(
+    list=Stub(),
+    get=Stub(),
+    presign=Stub(),
+    get_by_hash=Stub(),
+    verify_lock=Stub(),
+)
 
-    app.dependency_overrides[require_viewer] = override_require_viewer
-    app.dependency_overrides[require_operator] = override_require_operator
 
-    yield TestClient(app)
+@pytest.fixture
+def captures_mocks(monkeypatch: pytest.MonkeyPatch) -> Generator[SimpleNamespace, None, None]:
+    """Patch the storage and processing calls made by the capture routes."""
+    mocks = _CAPTURES_MOCKS
+    monkeypatch.setattr(captures_routes, "list_captures_by_user", mocks.list)
+    monkeypatch.setattr(captures_routes, "get_capture", mocks.get)
+    monkeypatch.setattr(captures_routes, "presign_download", mocks.presign)
+    # The verify route imports these at call time, so patch their source modules
+    monkeypatch.setattr(dynamo, "get_capture_by_hash", mocks.get_by_hash)
+    monkeypatch.setattr(s3, "verify_object_lock", mocks.verify_lock)
+
+    yield mocks
 
-    # Clean up dependency overrides
-    app.dependency_overrides.clear()
+    for stub in vars(mocks).values():
+        stub.reset()
 
 
 class TestListCaptures:
     """Test the list captures endpoint."""
 
-    @patch("app.api.routes.captures.list_captures_by_user")
-    def test_list_captures_success(self, mock_list: MagicMock, client: TestClient) -> None:
+    async def test_list_captures_success(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
+    ) -> None:
         """Test successful capture listing."""
         # Mock DynamoDB response
-        mock_list.return_value = {
+        captures_mocks.list.return_value = {
             "items": [
+                {**BASE_CAPTURE, "capture_id": "capture-1"},
                 {
-                    "capture_id": "capture-1",
-                    "sha256": "hash1",
-                    "s3_key": "key1",
-                    "artifact_type": "pdf",
-                    "url": "https://example1.com",
-                    "created_at": 1234567890.0,
-                    "status": "completed",
-                },
-                {
+                    **BASE_CAPTURE,
                     "capture_id": "capture-2",
-                    "sha256": "hash2",
-                    "s3_key": "key2",
                     "artifact_type": "png",
-                    "url": "https://example2.com",
                     "created_at": 1234567891.0,
-                    "status": "completed",
                 },
             ],
             "count": 2,
             "last_evaluated_key": None,
         }
 
-        response = client.get("/api/captures")
+        response = await aclient.get("/api/captures")
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert len(data) == 2
         assert data[0]["id"] == "capture-1"
         assert data[1]["id"] == "capture-2"
 
-    @patch("app.api.routes.captures.list_captures_by_user")
-    def test_list_captures_with_pagination(self, mock_list: MagicMock, client: TestClient) -> None:
+    @pytest.mark.unit
+    async def test_list_captures_with_pagination(self, captures_mocks: SimpleNamespace) -> None:
         """Test capture listing with pagination parameters."""
-        mock_list.return_value = {"items": [], "count": 0, "last_evaluated_key": None}
+        captures_mocks.list.return_value = {"items": [], "count": 0, "last_evaluated_key": None}
 
-        response = client.get('/api/captures?limit=10&last_key={"capture_id":"test-capture"}')
-
-        assert response.status_code == 200
-        mock_list.assert_called_once_with(
-            user_id="test-user-123",
-            limit=10,
-            last_evaluated_key={"capture_id": "test-capture"},  # Proper JSON object
+        await list_captures(
+            limit=10, last_key='{"capture_id":"test-capture"}', user_info=_MOCK_USER
         )
 
-    def test_list_captures_invalid_pagination_token(self, client: TestClient) -> None:
-        """Test capture listing with invalid pagination token."""
-        response = client.get("/api/captures?last_key=invalid-json")
-
-        assert response.status_code == 400
-        assert "Invalid pagination token" in response.json()["detail"]
+        assert captures_mocks.list.calls == [
+            (
+                (),
+                {
+                    "user_id": "test-user-123",
+                    "limit": 10,
+                    "last_evaluated_key": {"capture_id": "test-capture"},  # Proper JSON object
+                },
+            )
+        ]
 
+    @pytest.mark.unit
+    async def test_list_captures_invalid_pagination_token(self) -> None:
+        """Test capture listing with invalid pagination token."""
+        with pytest.raises(HTTPException) as exc_info:
+            await list_captures(limit=50, last_key="invalid-json", user_info=_MOCK_USER)
 
-class TestGetCapture:
-    """Test the get single capture endpoint."""
+        assert exc_info.value.status_code == 400
+        assert "Invalid pagination token" in exc_info.value.detail
 
-    @patch("app.api.routes.captures.get_capture")
-    def test_get_capture_success(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test successful capture retrieval."""
-        capture_id = "test-capture-123"
-        mock_get.return_value = {
-            "capture_id": capture_id,
-            "user_id": "test-user-123",
-            "sha256": "test-hash",
-            "s3_key": "test-key",
-            "artifact_type": "pdf",
-            "url": "https://example.com",
-            "created_at": 1234567890.0,
-            "status": "completed",
-        }
 
-        response = client.get(f"/api/captures/{capture_id}")
+async def _call_route(route_call: Awaitable[Any]) -> tuple[int, Any]:
+    """Await a route function and return (status code, body) as the HTTP layer would."""
+    try:
+        result = await route_call
+    except HTTPException as e:
+        return e.status_code, {"detail": e.detail}
+    return 200, result.model_dump() if isinstance(result, BaseModel) else result
 
-        assert response.status_code == 200
-        data = response.json()
-        assert data["id"] == capture_id
-        assert data["url"] == "https://example.com"
 
-    @patch("app.api.routes.captures.get_capture")
-    def test_get_capture_not_found(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test capture retrieval when capture doesn't exist."""
-        mock_get.return_value = None
+_CAPTURE_ID = "test-capture-123"
+_SIGNED_URL = "https://s3.amazonaws.com/bucket/key?signed-url"
 
-        response = client.get("/api/captures/nonexistent")
 
-        assert response.status_code == 404
-        assert "Capture not found" in response.json()["detail"]
+class TestGetCapture:
+    """Test the get single capture endpoint."""
 
-    @patch("app.api.routes.captures.get_capture")
-    def test_get_capture_access_denied(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test capture retrieval with access denied."""
-        mock_get.return_value = {
-            "capture_id": "test-capture",
-            "user_id": "other-user",  # Different user
-            "sha256": "test-hash",
-            "s3_key": "test-key",
-            "artifact_type": "pdf",
-            "url": "https://example.com",
-            "created_at": 1234567890.0,
-        }
+    @pytest.mark.parametrize(
+        ("capture", "status_code", "expected"),
+        [
+            pytest.param(
+                {**BASE_CAPTURE, "capture_id": _CAPTURE_ID},
+                200,
+                {"id": _CAPTURE_ID, "url": "https://example.com"},
+                id="success",
+            ),
+            pytest.param(None, 404, {"detail": "Capture not found"}, id="not_found"),
+            pytest.param(
+                {**BASE_CAPTURE, "capture_id": _CAPTURE_ID, "user_id": "other-user"},
+                403,
+                {"detail": "Access denied"},
+                id="access_denied",
+            ),
+            pytest.param(
+                {**BASE_CAPTURE_NO_STATUS, "capture_id": _CAPTURE_ID},
+                200,
+                {"status": "completed"},  # Missing status should default to "completed"
+                id="missing_status",
+            ),
+        ],
+    )
+    @pytest.mark.unit
+    async def test_get_capture(
+        self,
+        captures_mocks: SimpleNamespace,
+        capture: dict[str, Any] | None,
+        status_code: int,
+        expected: dict[str, Any],
+    ) -> None:
+        """Test capture retrieval for found, missing and foreign captures."""
+        captures_mocks.get.return_value = capture
 
-        response = client.get("/api/captures/test-capture")
+        actual_status, data = await _call_route(
+            get_capture_by_id(capture_id=_CAPTURE_ID, user_info=_MOCK_USER)
+        )
 
-        assert response.status_code == 403
-        assert "Access denied" in response.json()["detail"]
+        assert actual_status == status_code
+        assert {key: data[key] for key in expected} == expected
 
-    @patch("app.api.routes.captures.get_capture")
-    def test_get_capture_missing_status(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test capture retrieval when status field is missing (should default)."""
-        capture_id = "test-capture-no-status"
-        mock_get.return_value = {
-            "capture_id": capture_id,
-            "user_id": "test-user-123",
-            "sha256": "test-hash",
-            "s3_key": "test-key",
-            "artifact_type": "pdf",
-            "url": "https://example.com",
-            "created_at": 1234567890.0,
-            # Missing status field
-        }
+    async def test_get_capture_http(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
+    ) -> None:
+        """Test capture retrieval through the HTTP stack (auth and serialization)."""
+        captures_mocks.get.return_value = {**BASE_CAPTURE, "capture_id": _CAPTURE_ID}
 
-        response = client.get(f"/api/captures/{capture_id}")
+        response = await aclient.get(f"/api/captures/{_CAPTURE_ID}")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["status"] == "completed"  # Should default to "completed"
+        data = jloads(response)
+        assert data["id"] == _CAPTURE_ID
+        assert data["url"] == "https://example.com"
 
 
 class TestDownloadCapture:
     """Test the download capture endpoint."""
 
-    @patch("app.api.routes.captures.presign_download")
-    @patch("app.api.routes.captures.get_capture")
-    def test_download_capture_success(
-        self, mock_get: MagicMock, mock_presign: MagicMock, client: TestClient
+    @pytest.mark.parametrize(
+        ("capture", "status_code", "expected"),
+        [
+            pytest.param(
+                {**BASE_CAPTURE, "capture_id": _CAPTURE_ID, "s3_key": "captures/test.pdf"},
+                200,
+                {
+                    "download_url": _SIGNED_URL,
+                    "expires_in": "900",
+                    "content_type": "application/pdf",
+                    "filename": f"{_CAPTURE_ID}.pdf",
+                },
+                id="success",
+            ),
+            pytest.param(None, 404, {"detail": "Capture not found"}, id="not_found"),
+            pytest.param(
+                {**BASE_CAPTURE, "capture_id": _CAPTURE_ID, "user_id": "other-user"},
+                403,
+                {"detail": "Access denied"},
+                id="access_denied",
+            ),
+            pytest.param(
+                {
+                    **BASE_CAPTURE,
+                    "capture_id": _CAPTURE_ID,
+                    "s3_key": "captures/test.png",
+                    "artifact_type": "png",
+                },
+                200,
+                {"content_type": "image/png", "filename": f"{_CAPTURE_ID}.png"},
+                id="png_content_type",
+            ),
+        ],
+    )
+    @pytest.mark.unit
+    async def test_download_capture(
+        self,
+        captures_mocks: SimpleNamespace,
+        capture: dict[str, Any] | None,
+        status_code: int,
+        expected: dict[str, Any],
     ) -> None:
-        """Test successful download URL generation."""
-        capture_id = "test-capture-123"
-        mock_get.return_value = {
-            "capture_id": capture_id,
-            "user_id": "test-user-123",
-            "s3_key": "captures/test.pdf",
-            "artifact_type": "pdf",
-        }
-        mock_presign.return_value = "https://s3.amazonaws.com/bucket/key?signed-url"
-
-        response = client.get(f"/api/captures/{capture_id}/download")
+        """Test download URL generation for found, missing and foreign captures."""
+        captures_mocks.get.return_value = capture
+        captures_mocks.presign.return_value = _SIGNED_URL
 
-        assert response.status_code == 200
-        data = response.json()
-        assert "download_url" in data
-        assert data["expires_in"] == "900"
-        assert data["content_type"] == "application/pdf"
-        assert data["filename"] == f"{capture_id}.pdf"
-
-    @patch("app.api.routes.captures.get_capture")
-    def test_download_capture_not_found(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test download when capture doesn't exist."""
-        mock_get.return_value = None
-
-        response = client.get("/api/captures/nonexistent/download")
-
-        assert response.status_code == 404
-
-    @patch("app.api.routes.captures.get_capture")
-    def test_download_capture_access_denied(self, mock_get: MagicMock, client: TestClient) -> None:
-        """Test download with access denied."""
-        mock_get.return_value = {
-            "capture_id": "test-capture",
-            "user_id": "other-user",  # Different user
-            "s3_key": "test-key",
-            "artifact_type": "pdf",
-        }
-
-        response = client.get("/api/captures/test-capture/download")
+        actual_status, data = await _call_route(
+            download_capture(capture_id=_CAPTURE_ID, user_info=_MOCK_USER)
+        )
 
-        assert response.status_code == 403
+        assert actual_status == status_code
+        assert {key: data[key] for key in expected} == expected
 
-    @patch("app.api.routes.captures.presign_download")
-    @patch("app.api.routes.captures.get_capture")
-    def test_download_capture_png_content_type(
-        self, mock_get: MagicMock, mock_presign: MagicMock, client: TestClient
+    async def test_download_capture_http(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
     ) -> None:
-        """Test download URL generation for PNG files has correct content type."""
-        capture_id = "test-png-capture"
-        mock_get.return_value = {
-            "capture_id": capture_id,
-            "user_id": "test-user-123",
-            "s3_key": "captures/test.png",
-            "artifact_type": "png",
-        }
-        mock_presign.return_value = "https://s3.amazonaws.com/bucket/key?signed-url"
+        """Test download URL generation through the HTTP stack (auth and serialization)."""
+        captures_mocks.get.return_value = {**BASE_CAPTURE, "capture_id": _CAPTURE_ID}
+        captures_mocks.presign.return_value = _SIGNED_URL
 
-        response = client.get(f"/api/captures/{capture_id}/download")
+        response = await aclient.get(f"/api/captures/{_CAPTURE_ID}/download")
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["content_type"] == "image/png"
-        assert data["filename"] == f"{capture_id}.png"
+        assert jloads(response)["download_url"] == _SIGNED_URL
 
 
 class TestTriggerCapture:
     """Test the trigger capture endpoint."""
 
-    @patch("app.api.routes.captures.process_capture_request")
-    def test_trigger_capture_success(self, mock_process: AsyncMock, client: TestClient) -> None:
+    # Reason: AsyncMock is costly to build; patch one in for the class, reset it per test
+    _proc: AsyncMock
+    _patch: Any
+
+    @classmethod
+    def setup_class(cls) -> None:
+        """Patch process_capture_request with one shared AsyncMock."""
+        cls._proc = AsyncMock()
+        cls._patch = patch.object(processor, "process_capture_request", cls._proc)
+        cls._patch.start()
+
+    @classmethod
+    def teardown_class(cls) -> None:
+        """Restore process_capture_request."""
+        cls._patch.stop()
+
+    def setup_method(self) -> None:
+        """Clear the configuration and calls left by the previous test."""
+        self._proc.reset_mock(return_value=True, side_effect=True)
+
+    async def test_trigger_capture_success(self, aclient: httpx.AsyncClient) -> None:
         """Test successful capture trigger."""
-        mock_process.return_value = {
+        self._proc.return_value = {
             "capture_id": "new-capture-123",
             "status": "completed",
             "url": "https://example.com",
@@ -265,20 +342,22 @@ class TestTriggerCapture:
             "artifact_type": "pdf",
         }
 
-        response = client.post(
+        response = await aclient.post(
             "/api/captures/trigger", params={"url": "https://example.com", "artifact_type": "pdf"}
         )
 
         assert response.status_code == 200
-        data = response.json()
-        assert data["capture_id"] == "new-capture-123"
+        data = jloads(response)
+        # The route generates its own capture_id and passes it to the processor
+        assert data["capture_id"] == self._proc.call_args.kwargs["capture_id"]
         assert data["status"] == "completed"
         assert data["url"] == "https://example.com"
+        assert data["s3_key"] == "captures/new-capture-123.pdf"
+        assert data["sha256"] == "test-hash"
 
-    @patch("app.api.routes.captures.process_capture_request")
-    def test_trigger_capture_png(self, mock_process: AsyncMock, client: TestClient) -> None:
+    async def test_trigger_capture_png(self, aclient: httpx.AsyncClient) -> None:
         """Test triggering PNG capture."""
-        mock_process.return_value = {
+        self._proc.return_value = {
             "capture_id": "png-capture-123",
             "status": "completed",
             "url": "https://example.com",
@@ -287,30 +366,29 @@ class TestTriggerCapture:
             "artifact_type": "png",
         }
 
-        response = client.post(
+        response = await aclient.post(
             "/api/captures/trigger", params={"url": "https://example.com", "artifact_type": "png"}
         )
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["artifact_type"] == "png"
 
-    @patch("app.api.routes.captures.process_capture_request")
-    def test_trigger_capture_failure(self, mock_process: AsyncMock, client: TestClient) -> None:
+    async def test_trigger_capture_failure(self, client_strict: httpx.AsyncClient) -> None:
         """Test capture trigger failure."""
-        mock_process.side_effect = Exception("Capture failed")
+        self._proc.side_effect = Exception("Capture failed")
 
-        response = client.post(
+        response = await client_strict.post(
             "/api/captures/trigger", params={"url": "https://example.com", "artifact_type": "pdf"}
         )
 
         assert response.status_code == 500
-        assert "Capture failed" in response.json()["detail"]
+        assert "Capture failed" in jloads(response)["detail"]
 
-    def test_trigger_capture_invalid_type(self, client: TestClient) -> None:
+    async def test_trigger_capture_invalid_type(self, aclient: httpx.AsyncClient) -> None:
         """Test capture trigger with invalid artifact type."""
 
-        response = client.post(
+        response = await aclient.post(
             "/api/captures/trigger",
             params={"url": "https://example.com", "artifact_type": "invalid"},
         )
@@ -321,64 +399,52 @@ class TestTriggerCapture:
 class TestVerifyCapture:
     """Test the verify capture endpoint."""
 
-    @patch("app.storage.s3.verify_object_lock")
-    @patch("app.storage.dynamo.get_capture_by_hash")
-    def test_verify_capture_success(
-        self, mock_get_hash: MagicMock, mock_verify: MagicMock, client: TestClient
+    async def test_verify_capture_success(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
     ) -> None:
         """Test successful capture verification."""
         sha256 = "test-hash-123"
-        mock_get_hash.return_value = {
-            "capture_id": "verified-capture",
-            "url": "https://example.com",
-            "artifact_type": "pdf",
-            "created_at": 1234567890.0,
-            "s3_key": "test-key",
-        }
-        mock_verify.return_value = True
+        captures_mocks.get_by_hash.return_value = {**BASE_CAPTURE, "capture_id": "verified-capture"}
+        captures_mocks.verify_lock.return_value = True
 
-        response = client.post("/api/captures/verify", params={"sha256": sha256})
+        response = await aclient.post("/api/captures/verify", params={"sha256": sha256})
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["verified"] is True
         assert data["capture_id"] == "verified-capture"
         assert data["object_lock_verified"] is True
         assert data["sha256"] == sha256
 
-    @patch("app.storage.dynamo.get_capture_by_hash")
-    def test_verify_capture_not_found(self, mock_get_hash: MagicMock, client: TestClient) -> None:
+    async def test_verify_capture_not_found(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
+    ) -> None:
         """Test verification when capture not found by hash."""
         sha256 = "nonexistent-hash"
-        mock_get_hash.return_value = None
+        captures_mocks.get_by_hash.return_value = None
 
-        response = client.post("/api/captures/verify", params={"sha256": sha256})
+        response = await aclient.post("/api/captures/verify", params={"sha256": sha256})
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["verified"] is False
         assert data["reason"] == "No capture found with this hash"
         assert data["sha256"] == sha256
 
-    @patch("app.storage.s3.verify_object_lock")
-    @patch("app.storage.dynamo.get_capture_by_hash")
-    def test_verify_capture_object_lock_failed(
-        self, mock_get_hash: MagicMock, mock_verify: MagicMock, client: TestClient
+    async def test_verify_capture_object_lock_failed(
+        self, captures_mocks: SimpleNamespace, aclient: httpx.AsyncClient
     ) -> None:
         """Test verification when Object Lock verification fails."""
         sha256 = "test-hash-456"
-        mock_get_hash.return_value = {
+        captures_mocks.get_by_hash.return_value = {
+            **BASE_CAPTURE,
             "capture_id": "unverified-capture",
-            "url": "https://example.com",
-            "artifact_type": "pdf",
-            "created_at": 1234567890.0,
-            "s3_key": "test-key",
         }
-        mock_verify.return_value = False  # Object Lock verification failed
+        captures_mocks.verify_lock.return_value = False  # Object Lock verification failed
 
-        response = client.post("/api/captures/verify", params={"sha256": sha256})
+        response = await aclient.post("/api/captures/verify", params={"sha256": sha256})
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["verified"] is True  # Capture exists
         assert data["object_lock_verified"] is False  # But Object Lock failed
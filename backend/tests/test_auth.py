@@ -1,6 +1,7 @@
 """Tests for JWT authentication functionality."""
 
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
 import pytest
 
@@ -18,6 +19,11 @@ from app.auth.deps import (
 )
 
 
+def _req(auth: str | None = None) -> SimpleNamespace:
+    """Build a minimal request stand-in with an optional Authorization header."""
+    return SimpleNamespace(headers={"Authorization": auth} if auth else {})
+
+
 class TestJWTAuthentication:
     """Test JWT token validation and user extraction."""
 
@@ -110,8 +116,7 @@ class TestJWTAuthentication:
     async def test_get_current_user_missing_header(self):
         """Test get_current_user with missing Authorization header."""
         # Arrange
-        mock_request = MagicMock()
-        mock_request.headers.get.return_value = None
+        mock_request = _req()
 
         # Act & Assert
         with pytest.raises(AuthenticationError) as exc_info:
@@ -122,8 +127,7 @@ class TestJWTAuthentication:
     async def test_get_current_user_invalid_scheme(self):
         """Test get_current_user with invalid authorization scheme."""
         # Arrange
-        mock_request = MagicMock()
-        mock_request.headers.get.return_value = "Basic invalid-token"
+        mock_request = _req("Basic invalid-token")
 
         # Act & Assert
         with pytest.raises(AuthenticationError) as exc_info:
@@ -134,8 +138,7 @@ class TestJWTAuthentication:
     async def test_get_current_user_invalid_format(self):
         """Test get_current_user with invalid header format."""
         # Arrange
-        mock_request = MagicMock()
-        mock_request.headers.get.return_value = "invalid-format"
+        mock_request = _req("invalid-format")
 
         # Act & Assert
         with pytest.raises(AuthenticationError) as exc_info:
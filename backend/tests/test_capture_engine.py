@@ -3,52 +3,48 @@
 from __future__ import annotations
 
 import hashlib
+from collections.abc import Generator
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
 from app.capture_engine.engine import capture_stub, capture_webpage
 
+# Expected hashes of the fake artifacts returned by the mock_playwright fixture
+_PDF_SHA = "38e0d178ad5a2608935ce2dc05481ef884c2f32eff3401a6e1b2d44a6ff07141"  # b"fake_pdf_content"
+_PNG_SHA = "d0aa9ef949e23c47eb11cd97ffac3063424ff77f52902c5e92fd399b300ef6af"  # b"fake_png_content"
+
 
 class TestCaptureWebpage:
     """Test the main capture webpage functionality."""
 
-    @pytest.mark.asyncio
-    async def test_capture_pdf_success(self, mock_playwright: dict[str, Any]) -> None:
-        """Test successful PDF capture."""
+    pytestmark = pytest.mark.asyncio
+
+    @pytest.mark.parametrize(
+        ("artifact_type", "expected_bytes", "expected_hash"),
+        [("pdf", b"fake_pdf_content", _PDF_SHA), ("png", b"fake_png_content", _PNG_SHA)],
+    )
+    async def test_capture_success(
+        self,
+        mock_playwright: dict[str, Any],
+        artifact_type: str,
+        expected_bytes: bytes,
+        expected_hash: str,
+    ) -> None:
+        """Test successful PDF and PNG capture."""
         url = "https://example.com"
-        artifact_type = "pdf"
 
         result = await capture_webpage(url, artifact_type)
 
-        assert result["url"] == url
-        assert result["artifact_type"] == artifact_type
-        assert result["data"] == b"fake_pdf_content"
-        assert result["content_length"] == len(b"fake_pdf_content")
-
-        # Verify SHA-256 hash is correct
-        expected_hash = hashlib.sha256(b"fake_pdf_content").hexdigest()
-        assert result["sha256"] == expected_hash
-
-    @pytest.mark.asyncio
-    async def test_capture_png_success(self, mock_playwright: dict[str, Any]) -> None:
-        """Test successful PNG capture."""
-        url = "https://example.com"
-        artifact_type = "png"
+        assert result == {
+            "url": url,
+            "artifact_type": artifact_type,
+            "data": expected_bytes,
+            "content_length": len(expected_bytes),
+            "sha256": expected_hash,
+        }
 
-        result = await capture_webpage(url, artifact_type)
-
-        assert result["url"] == url
-        assert result["artifact_type"] == artifact_type
-        assert result["data"] == b"fake_png_content"
-        assert result["content_length"] == len(b"fake_png_content")
-
-        # Verify SHA-256 hash is correct
-        expected_hash = hashlib.sha256(b"fake_png_content").hexdigest()
-        assert result["sha256"] == expected_hash
-
-    @pytest.mark.asyncio
     async def test_capture_invalid_artifact_type(self, mock_playwright: dict[str, Any]) -> None:
         """Test capture with invalid artifact type."""
         url = "https://example.com"
@@ -57,7 +53,6 @@ class TestCaptureWebpage:
         with pytest.raises(ValueError, match="Invalid artifact_type: invalid"):
             await capture_webpage(url, artifact_type)
 
-    @pytest.mark.asyncio
     async def test_capture_with_custom_viewport(self, mock_playwright: dict[str, Any]) -> None:
         """Test capture with custom viewport settings."""
         url = "https://example.com"
@@ -76,7 +71,6 @@ class TestCaptureWebpage:
         assert context_kwargs["viewport"]["width"] == viewport_width
         assert context_kwargs["viewport"]["height"] == viewport_height
 
-    @pytest.mark.asyncio
     async def test_capture_browser_lifecycle(self, mock_playwright: dict[str, Any]) -> None:
         """Test that browser and context are properly closed."""
         url = "https://example.com"
@@ -90,7 +84,6 @@ class TestCaptureWebpage:
         mock_context.close.assert_called_once()
         mock_browser.close.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_capture_page_navigation(self, mock_playwright: dict[str, Any]) -> None:
         """Test that page navigation is called correctly."""
         url = "https://example.com"
@@ -102,7 +95,6 @@ class TestCaptureWebpage:
 
         mock_page.goto.assert_called_once_with(url, wait_until="networkidle", timeout=30000)
 
-    @pytest.mark.asyncio
     async def test_capture_pdf_generation(self, mock_playwright: dict[str, Any]) -> None:
         """Test PDF generation with correct parameters."""
         url = "https://example.com"
@@ -119,7 +111,6 @@ class TestCaptureWebpage:
             margin={"top": "1cm", "bottom": "1cm", "left": "1cm", "right": "1cm"},
         )
 
-    @pytest.mark.asyncio
     async def test_capture_screenshot_generation(self, mock_playwright: dict[str, Any]) -> None:
         """Test screenshot generation with correct parameters."""
         url = "https://example.com"
@@ -136,60 +127,51 @@ class TestCaptureWebpage:
         )
 
 
-class TestCaptureStub:
-    """Test the synchronous capture stub wrapper."""
-
-    def test_capture_stub_pdf(self) -> None:
-        """Test capture stub for PDF."""
-        url = "https://example.com"
-        artifact_type = "pdf"
+@pytest.fixture(scope="class")
+def _patched_capture_webpage() -> Generator[AsyncMock, None, None]:
+    """Patch the async capture function wrapped by capture_stub, once per class."""
+    with patch("app.capture_engine.engine.capture_webpage") as mock_capture:
+        yield mock_capture
 
-        with patch("app.capture_engine.engine.capture_webpage") as mock_capture:
-            mock_capture.return_value = {
-                "data": b"test_data",
-                "sha256": "test_hash",
-                "artifact_type": artifact_type,
-                "url": url,
-                "content_length": 9,
-            }
 
-            result = capture_stub(url, artifact_type)
-
-            assert result["url"] == url
-            assert result["artifact_type"] == artifact_type
+class TestCaptureStub:
+    """Test the synchronous capture stub wrapper."""
 
-    def test_capture_stub_png(self) -> None:
-        """Test capture stub for PNG."""
+    @pytest.fixture
+    def mock_capture_webpage(self, _patched_capture_webpage: AsyncMock) -> AsyncMock:
+        """Provide the class-wide capture_webpage patch with fresh call records."""
+        _patched_capture_webpage.reset_mock()
+        return _patched_capture_webpage
+
+    @pytest.mark.parametrize(
+        ("artifact_type", "expected_type"),
+        [("pdf", "pdf"), ("png", "png"), (None, "pdf")],
+        ids=["pdf", "png", "default_type"],
+    )
+    def test_capture_stub(
+        self, mock_capture_webpage: AsyncMock, artifact_type: str | None, expected_type: str
+    ) -> None:
+        """Test capture stub for each artifact type, including the default."""
         url = "https://example.com"
-        artifact_type = "png"
-
-        with patch("app.capture_engine.engine.capture_webpage") as mock_capture:
-            mock_capture.return_value = {
-                "data": b"test_data",
-                "sha256": "test_hash",
-                "artifact_type": artifact_type,
-                "url": url,
-                "content_length": 9,
-            }
-
-            result = capture_stub(url, artifact_type)
+        mock_capture_webpage.return_value = {
+            "data": b"test_data",
+            "sha256": "test_hash",
+            "artifact_type": expected_type,
+            "url": url,
+            "content_length": 9,
+        }
 
-            assert result["url"] == url
-            assert result["artifact_type"] == artifact_type
+        result = capture_stub(url) if artifact_type is None else capture_stub(url, artifact_type)
 
-    def test_capture_stub_default_type(self) -> None:
-        """Test capture stub with default artifact type."""
-        url = "https://example.com"
-
-        with patch("app.capture_engine.engine.capture_webpage") as mock_capture:
-            mock_capture.return_value = {
-                "data": b"test_data",
-                "sha256": "test_hash",
-                "artifact_type": "pdf",
-                "url": url,
-                "content_length": 9,
-            }
+        assert result["url"] == url
+        assert result["artifact_type"] == expected_type
+        mock_capture_webpage.assert_called_once_with(url, expected_type)
 
-            result = capture_stub(url)
 
-            assert result["artifact_type"] == "pdf"
+@pytest.mark.parametrize(
+    ("content", "expected_hash"),
+    [(b"fake_pdf_content", _PDF_SHA), (b"fake_png_content", _PNG_SHA)],
+)
+def test_sha_constant_sanity(content: bytes, expected_hash: str) -> None:
+    """Guard the precomputed hash constants against drift from the fixture content."""
+    assert hashlib.sha256(content).hexdigest() == expected_hash
@@ -1,79 +1,98 @@
 """Integration tests for authentication in API routes."""
 
-from unittest.mock import patch
+from collections.abc import Generator
+from unittest.mock import MagicMock, patch
 
-from fastapi.testclient import TestClient
+import httpx
+import pytest
 
-from app.main import app
+from app.auth.deps import AuthenticationError
+from tests._helpers import jloads
+
+_AVAILABLE_ROLES = ["viewer", "operator", "admin"]
+
+# Reason: the session-scoped aclient and the tests have to share one event loop
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest.fixture(scope="module")
+def verify_mock() -> Generator[MagicMock, None, None]:
+    """Patch JWT verification once for the whole module."""
+    with patch("app.auth.deps.verify_jwt_token") as mock_verify:
+        yield mock_verify
+
+
+@pytest.fixture(autouse=True)
+def _reset_verify_mock(verify_mock: MagicMock) -> None:
+    """Clear the configuration and calls left by the previous test."""
+    verify_mock.reset_mock(return_value=True, side_effect=True)
 
 
 class TestAuthenticationIntegration:
     """Test authentication integration with API routes."""
 
-    def setup_method(self):
-        """Set up test client."""
-        self.client = TestClient(app)
+    @pytest.fixture(autouse=True)
+    def _client(self, aclient: httpx.AsyncClient) -> None:
+        """Use the session-wide ASGI client."""
+        self.client = aclient
 
-    def test_health_endpoint_no_auth_required(self):
+    async def test_health_endpoint_no_auth_required(self):
         """Test that health endpoint doesn't require authentication."""
-        response = self.client.get("/api/health")
+        response = await self.client.get("/api/health")
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["status"] == "healthy"
         assert "auth" in data
 
-    def test_auth_config_no_auth_required(self):
+    async def test_auth_config_no_auth_required(self):
         """Test that auth config endpoint doesn't require authentication."""
-        response = self.client.get("/api/auth/config")
+        response = await self.client.get("/api/auth/config")
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert "cognito" in data
         assert "roles" in data
-        assert data["roles"]["available"] == ["viewer", "operator", "admin"]
+        assert data["roles"]["available"] == _AVAILABLE_ROLES
 
-    def test_protected_endpoint_no_token(self):
+    async def test_protected_endpoint_no_token(self):
         """Test that protected endpoints require authentication."""
-        response = self.client.get("/api/captures")
+        response = await self.client.get("/api/captures")
         assert response.status_code == 401
-        assert "Authorization header missing" in response.json()["detail"]
+        assert "Authorization header missing" in jloads(response)["detail"]
 
-    def test_protected_endpoint_invalid_token(self):
+    async def test_protected_endpoint_invalid_token(self, verify_mock: MagicMock):
         """Test that protected endpoints reject invalid tokens."""
         headers = {"Authorization": "Bearer invalid-token"}
 
-        with patch("app.auth.deps.verify_jwt_token") as mock_verify:
-            from app.auth.deps import AuthenticationError
-
-            mock_verify.side_effect = AuthenticationError("Invalid token")
+        verify_mock.side_effect = AuthenticationError("Invalid token")
 
-            response = self.client.get("/api/captures", headers=headers)
-            assert response.status_code == 401
+        response = await self.client.get("/api/captures", headers=headers)
+        assert response.status_code == 401
 
-    def test_protected_endpoint_insufficient_role(self):
+    async def test_protected_endpoint_insufficient_role(self, verify_mock: MagicMock):
         """Test that endpoints check role requirements."""
         headers = {"Authorization": "Bearer valid-token"}
 
         # Mock a viewer user trying to access operator endpoint
-        with patch("app.auth.deps.verify_jwt_token") as mock_verify:
-            mock_verify.return_value = {
-                "sub": "user-123",
-                "email": "viewer@example.com",
-                "role": "viewer",
-                "cognito_groups": ["auditor"],
-            }
-
-            response = self.client.post(
-                "/api/captures/trigger?url=https://example.com", headers=headers
-            )
-            assert response.status_code == 403
-            assert "Role 'operator' required" in response.json()["detail"]
+        verify_mock.return_value = {
+            "sub": "user-123",
+            "email": "viewer@example.com",
+            "role": "viewer",
+            "cognito_groups": ["auditor"],
+        }
+
+        response = await self.client.post(
+            "/api/captures/trigger?url=https://example.com", headers=headers
+        )
+        assert response.status_code == 403
+        assert "Role 'operator' required" in jloads(response)["detail"]
 
     @patch("app.api.routes.captures.list_captures_by_user")
-    @patch("app.auth.deps.verify_jwt_token")
-    def test_successful_authenticated_request(self, mock_verify, mock_list_captures):
+    async def test_successful_authenticated_request(
+        self, mock_list_captures, verify_mock: MagicMock
+    ):
         """Test successful authenticated request."""
         # Mock authentication
-        mock_verify.return_value = {
+        verify_mock.return_value = {
             "sub": "user-123",
             "email": "user@example.com",
             "role": "viewer",
@@ -84,21 +103,20 @@ class TestAuthenticationIntegration:
         mock_list_captures.return_value = {"items": []}
 
         headers = {"Authorization": "Bearer valid-token"}
-        response = self.client.get("/api/captures", headers=headers)
+        response = await self.client.get("/api/captures", headers=headers)
 
         assert response.status_code == 200
-        assert response.json() == []
+        assert jloads(response) == []
 
         # Verify user ID was passed to database query
         mock_list_captures.assert_called_once()
         call_args = mock_list_captures.call_args
         assert call_args[1]["user_id"] == "user-123"
 
-    @patch("app.auth.deps.verify_jwt_token")
-    def test_auth_status_endpoint(self, mock_verify):
+    async def test_auth_status_endpoint(self, verify_mock: MagicMock):
         """Test authentication status endpoint."""
         # Mock authentication
-        mock_verify.return_value = {
+        verify_mock.return_value = {
             "sub": "user-123",
             "email": "operator@example.com",
             "role": "operator",
@@ -106,10 +124,10 @@ class TestAuthenticationIntegration:
         }
 
         headers = {"Authorization": "Bearer valid-token"}
-        response = self.client.get("/api/auth/status", headers=headers)
+        response = await self.client.get("/api/auth/status", headers=headers)
 
         assert response.status_code == 200
-        data = response.json()
+        data = jloads(response)
         assert data["authenticated"] is True
         assert data["user_id"] == "user-123"
         assert data["role"] == "operator"
@@ -117,16 +135,16 @@ class TestAuthenticationIntegration:
         assert data["permissions"]["can_trigger_captures"] is True
         assert data["permissions"]["can_admin"] is False
 
-    def test_invalid_authorization_scheme(self):
+    async def test_invalid_authorization_scheme(self):
         """Test invalid authorization scheme."""
         headers = {"Authorization": "Basic invalid-token"}
-        response = self.client.get("/api/captures", headers=headers)
+        response = await self.client.get("/api/captures", headers=headers)
         assert response.status_code == 401
-        assert "Invalid authorization scheme" in response.json()["detail"]
+        assert "Invalid authorization scheme" in jloads(response)["detail"]
 
-    def test_malformed_authorization_header(self):
+    async def test_malformed_authorization_header(self):
         """Test malformed authorization header."""
         headers = {"Authorization": "Bearer"}
-        response = self.client.get("/api/captures", headers=headers)
+        response = await self.client.get("/api/captures", headers=headers)
         assert response.status_code == 401
-        assert "Invalid authorization header format" in response.json()["detail"]
+        assert "Invalid authorization header format" in jloads(response)["detail"]
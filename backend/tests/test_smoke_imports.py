@@ -0,0 +1,23 @@
+"""Smoke tests for the modules loaded by the API Lambda."""
+
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "module_name", ["mangum", "app.core.logging", "app.lambda_handler", "app.main"]
+)
+def test_importable(module_name: str) -> None:
+    """Test that each module on the Lambda import path imports cleanly."""
+    importlib.import_module(module_name)
+
+
+def test_handler_created() -> None:
+    """Test that the Mangum handler can be created and the entry point exists."""
+    lambda_module = importlib.import_module("app.lambda_handler")
+
+    assert lambda_module.create_handler() is not None
+    assert callable(lambda_module.lambda_handler)
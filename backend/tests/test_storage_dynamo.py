@@ -2,16 +2,21 @@
 
 from __future__ import annotations
 
+import uuid
+from collections.abc import Callable, Generator, Mapping
 from decimal import Decimal
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import Mock, patch
 
 import pytest
 from botocore.exceptions import ClientError
 
+from app.core.config import settings
 from app.storage.dynamo import (
     CaptureData,
     ScheduleData,
+    capture_item,
     create_capture,
     create_schedule,
     delete_schedule,
@@ -22,13 +27,95 @@ from app.storage.dynamo import (
     list_schedules_by_user,
     update_schedule,
 )
+from tests._helpers import bulk_create_captures, bulk_create_schedules
+
+
+def _raising(code: str, message: str, operation: str) -> Callable[..., Any]:
+    """Build a side_effect that raises a fresh ClientError on every call.
+
+    A shared instance would carry its __traceback__ and __context__ from test to test.
+    """
+
+    def raise_error(*args: Any, **kwargs: Any) -> Any:
+        raise ClientError({"Error": {"Code": code, "Message": message}}, operation)
+
+    return raise_error
+
+
+# side_effects raising the DynamoDB errors used by the error-handling tests
+_raise_put_validation = _raising("ValidationException", "Validation error", "PutItem")
+_raise_query_not_found = _raising("ResourceNotFoundException", "Table not found", "Query")
+
+# Capture records for the list tests: three for test-user-123 plus one for another user
+_USER_CAPTURES = [
+    *(
+        CaptureData(
+            capture_id=f"capture-{i}",
+            url=f"https://example{i}.com",
+            sha256=f"hash{i}",
+            s3_key=f"key{i}",
+            artifact_type="pdf",
+            user_id="test-user-123",
+        )
+        for i in range(3)
+    ),
+    CaptureData(
+        capture_id="other-capture",
+        url="https://other.com",
+        sha256="other-hash",
+        s3_key="other-key",
+        artifact_type="pdf",
+        user_id="other-user",
+    ),
+]
+
+# Five capture records for test-user-456, used by the pagination test
+_LIMITED_CAPTURES = [
+    CaptureData(
+        capture_id=f"limited-capture-{i}",
+        url=f"https://limited{i}.com",
+        sha256=f"limited-hash{i}",
+        s3_key=f"limited-key{i}",
+        artifact_type="pdf",
+        user_id="test-user-456",
+    )
+    for i in range(5)
+]
+
+# Fixed clock for record timestamps (2024-01-01T00:00:00Z)
+_FROZEN_TIME = 1704067200.0
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _freeze_time() -> Generator[None, None, None]:
+    """Pin the clock that app.storage.dynamo uses for created_at/updated_at."""
+    with patch("app.storage.dynamo.time", SimpleNamespace(time=lambda: _FROZEN_TIME)):
+        yield
+
+
+@pytest.fixture
+def many_captures(mock_dynamodb_tables: dict[str, Any]) -> list[CaptureData]:
+    """Seed _LIMITED_CAPTURES with a single BatchWriteItem call."""
+    mock_dynamodb_tables["captures"].meta.client.batch_write_item(
+        RequestItems={
+            settings.ddb_table_captures: [
+                {"PutRequest": {"Item": capture_item(data)}} for data in _LIMITED_CAPTURES
+            ]
+        }
+    )
+    return _LIMITED_CAPTURES
+
+
+def _unique_id(prefix: str) -> str:
+    """Build an ID unique to the calling test so tests don't depend on run order."""
+    return f"{prefix}-{uuid.uuid4().hex}"
 
 
 class TestCaptureOperations:
     """Test capture-related DynamoDB operations."""
 
     def test_create_capture_success(
-        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: dict[str, Any]
+        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: Mapping[str, Any]
     ) -> None:
         """Test successful capture creation."""
         data = sample_capture_data
@@ -70,7 +157,7 @@ class TestCaptureOperations:
         assert result["metadata"] == {}
 
     def test_get_capture_success(
-        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: dict[str, Any]
+        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: Mapping[str, Any]
     ) -> None:
         """Test successful capture retrieval."""
         data = sample_capture_data
@@ -106,26 +193,8 @@ class TestCaptureOperations:
         """Test listing captures by user."""
         user_id = "test-user-123"
 
-        # Create multiple captures for the user
-        for i in range(3):
-            create_capture(
-                capture_id=f"capture-{i}",
-                url=f"https://example{i}.com",
-                sha256=f"hash{i}",
-                s3_key=f"key{i}",
-                artifact_type="pdf",
-                user_id=user_id,
-            )
-
-        # Create capture for different user
-        create_capture(
-            capture_id="other-capture",
-            url="https://other.com",
-            sha256="other-hash",
-            s3_key="other-key",
-            artifact_type="pdf",
-            user_id="other-user",
-        )
+        # Create multiple captures for the user, plus one for a different user
+        bulk_create_captures(_USER_CAPTURES)
 
         result = list_captures_by_user(user_id)
 
@@ -136,20 +205,9 @@ class TestCaptureOperations:
         for item in result["items"]:
             assert item["user_id"] == user_id
 
-    def test_list_captures_by_user_with_limit(self, mock_dynamodb_tables: dict[str, Any]) -> None:
+    def test_list_captures_by_user_with_limit(self, many_captures: list[CaptureData]) -> None:
         """Test listing captures with pagination limit."""
-        user_id = "test-user-456"
-
-        # Create 5 captures
-        for i in range(5):
-            create_capture(
-                capture_id=f"limited-capture-{i}",
-                url=f"https://limited{i}.com",
-                sha256=f"limited-hash{i}",
-                s3_key=f"limited-key{i}",
-                artifact_type="pdf",
-                user_id=user_id,
-            )
+        user_id = many_captures[0].user_id
 
         result = list_captures_by_user(user_id, limit=3)
 
@@ -157,19 +215,21 @@ class TestCaptureOperations:
         assert len(result["items"]) == 3
 
     def test_get_capture_by_hash(
-        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: dict[str, Any]
+        self, mock_dynamodb_tables: dict[str, Any], sample_capture_data: Mapping[str, Any]
     ) -> None:
         """Test finding capture by SHA-256 hash."""
         data = sample_capture_data
 
         # Create capture
         create_capture(
-            capture_id=data["capture_id"],
-            url=data["url"],
-            sha256=data["sha256"],
-            s3_key=data["s3_key"],
-            artifact_type=data["artifact_type"],
-            user_id=data["user_id"],
+            CaptureData(
+                capture_id=data["capture_id"],
+                url=data["url"],
+                sha256=data["sha256"],
+                s3_key=data["s3_key"],
+                artifact_type=data["artifact_type"],
+                user_id=data["user_id"],
+            )
         )
 
         # Find by hash
@@ -191,8 +251,8 @@ class TestScheduleOperations:
 
     def test_create_schedule_success(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test successful schedule creation."""
-        schedule_id = "test-schedule-123"
-        user_id = "test-user"
+        schedule_id = _unique_id("sched")
+        user_id = _unique_id("user")
         url = "https://example.com"
         cron_expression = "0 9 * * MON"
 
@@ -221,8 +281,8 @@ class TestScheduleOperations:
     def test_create_schedule_with_defaults(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test schedule creation with default values."""
         result = create_schedule(
-            schedule_id="default-schedule",
-            user_id="test-user",
+            schedule_id=_unique_id("sched"),
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
         )
@@ -233,12 +293,12 @@ class TestScheduleOperations:
 
     def test_get_schedule_success(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test successful schedule retrieval."""
-        schedule_id = "get-test-schedule"
+        schedule_id = _unique_id("sched")
 
         # Create schedule
         create_schedule(
             schedule_id=schedule_id,
-            user_id="test-user",
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
         )
@@ -257,23 +317,27 @@ class TestScheduleOperations:
 
     def test_list_schedules_by_user(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test listing schedules by user."""
-        user_id = "schedule-user-123"
-
-        # Create multiple schedules for the user
-        for i in range(3):
-            create_schedule(
-                schedule_id=f"user-schedule-{i}",
-                user_id=user_id,
-                url=f"https://schedule{i}.com",
-                cron_expression="0 9 * * *",
-            )
-
-        # Create schedule for different user
-        create_schedule(
-            schedule_id="other-user-schedule",
-            user_id="other-user",
-            url="https://other.com",
-            cron_expression="0 9 * * *",
+        user_id = _unique_id("user")
+
+        # Create multiple schedules for the user, plus one for a different user
+        bulk_create_schedules(
+            [
+                *(
+                    ScheduleData(
+                        schedule_id=_unique_id("sched"),
+                        user_id=user_id,
+                        url=f"https://schedule{i}.com",
+                        cron_expression="0 9 * * *",
+                    )
+                    for i in range(3)
+                ),
+                ScheduleData(
+                    schedule_id=_unique_id("sched"),
+                    user_id=_unique_id("user"),
+                    url="https://other.com",
+                    cron_expression="0 9 * * *",
+                ),
+            ]
         )
 
         result = list_schedules_by_user(user_id)
@@ -287,12 +351,12 @@ class TestScheduleOperations:
 
     def test_update_schedule_success(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test successful schedule update."""
-        schedule_id = "update-test-schedule"
+        schedule_id = _unique_id("sched")
 
         # Create schedule
         create_schedule(
             schedule_id=schedule_id,
-            user_id="test-user",
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
             enabled=True,
@@ -328,12 +392,12 @@ class TestScheduleOperations:
         self, mock_dynamodb_tables: dict[str, Any]
     ) -> None:
         """Test updating schedule with multiple reserved keywords."""
-        schedule_id = "reserved-keyword-test"
+        schedule_id = _unique_id("sched")
 
         # Create schedule
         create_schedule(
             schedule_id=schedule_id,
-            user_id="test-user",
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
         )
@@ -356,12 +420,12 @@ class TestScheduleOperations:
         self, mock_dynamodb_tables: dict[str, Any]
     ) -> None:
         """Test updating schedule with no reserved keywords."""
-        schedule_id = "no-reserved-test"
+        schedule_id = _unique_id("sched")
 
         # Create schedule
         create_schedule(
             schedule_id=schedule_id,
-            user_id="test-user",
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
         )
@@ -382,12 +446,12 @@ class TestScheduleOperations:
 
     def test_delete_schedule_success(self, mock_dynamodb_tables: dict[str, Any]) -> None:
         """Test successful schedule deletion."""
-        schedule_id = "delete-test-schedule"
+        schedule_id = _unique_id("sched")
 
         # Create schedule
         create_schedule(
             schedule_id=schedule_id,
-            user_id="test-user",
+            user_id=_unique_id("user"),
             url="https://example.com",
             cron_expression="0 9 * * *",
         )
@@ -415,12 +479,10 @@ class TestErrorHandling:
     def test_create_capture_error(self) -> None:
         """Test capture creation with DynamoDB error."""
         with patch("app.storage.dynamo.table") as mock_table:
-            mock_table_instance = MagicMock()
+            mock_table_instance = Mock()
             mock_table.return_value = mock_table_instance
 
-            mock_table_instance.put_item.side_effect = ClientError(
-                {"Error": {"Code": "ValidationException", "Message": "Validation error"}}, "PutItem"
-            )
+            mock_table_instance.put_item.side_effect = _raise_put_validation
 
             with pytest.raises(ClientError):
                 create_capture(
@@ -435,13 +497,10 @@ class TestErrorHandling:
     def test_get_capture_error(self) -> None:
         """Test capture retrieval with DynamoDB error."""
         with patch("app.storage.dynamo.table") as mock_table:
-            mock_table_instance = MagicMock()
+            mock_table_instance = Mock()
             mock_table.return_value = mock_table_instance
 
-            mock_table_instance.query.side_effect = ClientError(
-                {"Error": {"Code": "ResourceNotFoundException", "Message": "Table not found"}},
-                "Query",
-            )
+            mock_table_instance.query.side_effect = _raise_query_not_found
 
             result = get_capture("error-test")
 
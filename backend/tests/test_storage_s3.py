@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from typing import Any
+from unittest.mock import create_autospec
+from urllib.parse import parse_qs, urlparse
 
 import pytest
+import time_machine
+from botocore.client import BaseClient
 from botocore.exceptions import ClientError
 
+from app.core.config import settings
+from app.storage import s3 as s3_mod
 from app.storage.s3 import (
     get_artifact,
     get_artifact_metadata,
@@ -16,204 +22,180 @@ from app.storage.s3 import (
     upload_artifact,
     verify_object_lock,
 )
+from tests._helpers import Stub
+
+# A well-formed version ID that no stored object has
+_UNKNOWN_VERSION_ID = "00000000-0000-0000-0000-000000000000"
+
+
+def _put_plain_object(client: Any, bucket: str, key: str, data: bytes) -> str:
+    """Store an object without Object Lock or metadata and return its version ID."""
+    response = client.put_object(Bucket=bucket, Key=key, Body=data)
+    return str(response["VersionId"])
+
+
+def _run_upload_case(
+    client: Any, bucket: str, key: str, data: bytes, metadata: dict[str, str] | None
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Upload through upload_artifact and return the stored object's head with the result."""
+    # Reason: upload_artifact adds compliance fields to the dict it's given; keep ours intact
+    result = upload_artifact(key, data, dict(metadata) if metadata is not None else None)
+    return client.head_object(Bucket=bucket, Key=key), result
+
+
+def _expires_in(url: str) -> int:
+    """Return the X-Amz-Expires value of a SigV4 presigned URL."""
+    return int(parse_qs(urlparse(url).query)["X-Amz-Expires"][0])
+
+
+@pytest.fixture(scope="session")
+def s3_mock_template() -> Any:
+    """A spec-bounded botocore client double, built once for the session."""
+    return create_autospec(BaseClient, instance=True, spec_set=True)
 
 
 class TestS3Client:
     """Test S3 client creation."""
 
-    def test_s3_client_creation(self) -> None:
+    def test_s3_client_creation(
+        self, s3_mock_template: Any, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test that S3 client is created with correct configuration."""
-        with patch("app.storage.s3.boto3.client") as mock_boto3:
-            mock_client = MagicMock()
-            mock_boto3.return_value = mock_client
-
-            client = s3_client()
-
-            assert client == mock_client
-            mock_boto3.assert_called_once()
+        s3_mock_template.reset_mock(return_value=True, side_effect=True)
+        boto3_client = Stub(s3_mock_template)
+
+        # Reason: s3_client is cached; clear it so the patched boto3.client is used, and
+        # again afterwards so later tests don't get the mock
+        s3_client.cache_clear()
+        try:
+            with monkeypatch.context() as m:
+                m.setattr(s3_mod.boto3, "client", boto3_client)
+                client = s3_client()
+                assert s3_client() is client  # Created once, then reused
+        finally:
+            s3_client.cache_clear()
+
+        assert client is s3_mock_template
+        assert len(boto3_client.calls) == 1
+        args, kwargs = boto3_client.calls[0]
+        assert args == ("s3",)
+        assert kwargs["region_name"] == "us-east-1"
+        assert kwargs["config"].signature_version == "s3v4"
 
 
 class TestUploadArtifact:
     """Test artifact upload functionality."""
 
-    def test_upload_artifact_success(self, mock_s3_bucket: str) -> None:
-        """Test successful artifact upload with Object Lock."""
-        key = "test/artifact.pdf"
-        data = b"test artifact content"
-        metadata = {"test": "value"}
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            # Mock successful upload response
-            mock_client.put_object.return_value = {
-                "VersionId": "test-version-id",
-                "ETag": '"test-etag"',
-            }
-
-            result = upload_artifact(key, data, metadata)
-
-            # Verify result structure
-            assert result["bucket"] == "test-artifacts-bucket"
-            assert result["key"] == key
-            assert result["version_id"] == "test-version-id"
-            assert result["etag"] == '"test-etag"'
-            assert result["object_lock_mode"] == "COMPLIANCE"
-            assert "retention_until" in result
-
-            # Verify put_object was called with correct parameters
-            mock_client.put_object.assert_called_once()
-            call_kwargs = mock_client.put_object.call_args[1]
-
-            assert call_kwargs["Bucket"] == "test-artifacts-bucket"
-            assert call_kwargs["Key"] == key
-            assert call_kwargs["Body"] == data
-            assert call_kwargs["ServerSideEncryption"] == "aws:kms"
-            assert call_kwargs["ObjectLockMode"] == "COMPLIANCE"
-            assert "ObjectLockRetainUntilDate" in call_kwargs
-
-    def test_upload_artifact_with_custom_retention(self, mock_s3_bucket: str) -> None:
+    @pytest.mark.parametrize(
+        ("key", "data", "metadata"),
+        [
+            pytest.param(
+                "upload/success.pdf", b"test artifact content", {"test": "value"}, id="success"
+            ),
+            pytest.param("upload/empty.pdf", b"", None, id="empty_data"),
+            pytest.param("upload/no-metadata.pdf", b"test content", None, id="no_metadata"),
+        ],
+    )
+    def test_upload_artifact(
+        self,
+        mock_s3_bucket: str,
+        s3_test_client: Any,
+        key: str,
+        data: bytes,
+        metadata: dict[str, str] | None,
+    ) -> None:
+        """Test artifact upload with Object Lock, KMS encryption and compliance metadata."""
+        head, result = _run_upload_case(s3_test_client, mock_s3_bucket, key, data, metadata)
+
+        # Verify result structure
+        assert result["bucket"] == mock_s3_bucket
+        assert result["key"] == key
+        assert result["version_id"] == head["VersionId"]
+        assert result["etag"]
+        assert result["object_lock_mode"] == "COMPLIANCE"
+        assert "retention_until" in result
+
+        # Verify the stored object carries the data and compliance settings
+        assert head["ContentLength"] == len(data)
+        assert head["ContentType"] == "application/pdf"
+        assert head["ServerSideEncryption"] == "aws:kms"
+        assert head["SSEKMSKeyId"] == settings.kms_key_arn
+        assert head["ObjectLockMode"] == "COMPLIANCE"
+        assert "ObjectLockRetainUntilDate" in head
+
+        # Compliance fields are always added on top of any caller metadata
+        assert "captured-at" in head["Metadata"]
+        assert "retention-until" in head["Metadata"]
+        assert (metadata or {}).items() <= head["Metadata"].items()
+
+    def test_upload_artifact_with_custom_retention(
+        self, mock_s3_bucket: str, s3_test_client: Any
+    ) -> None:
         """Test artifact upload with custom retention period."""
-        key = "test/artifact.pdf"
+        key = "upload/custom-retention.pdf"
         data = b"test content"
         retention_days = 365  # 1 year
+        now = datetime(2030, 1, 1, tzinfo=UTC)
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.put_object.return_value = {"VersionId": "test-version"}
-
-            before_upload = datetime.now(UTC)
+        # Freeze the clock so the retention date can be compared exactly
+        with time_machine.travel(now, tick=False):
             result = upload_artifact(key, data, retention_days=retention_days)
-            after_upload = datetime.now(UTC)
 
-            # Parse retention date and verify it's approximately correct
-            retention_date = datetime.fromisoformat(result["retention_until"])
-            expected_retention = before_upload + timedelta(days=retention_days)
+        retention_date = datetime.fromisoformat(result["retention_until"])
+        assert retention_date == now + timedelta(days=retention_days)
 
-            # Allow 1 minute tolerance for test execution time
-            assert abs((retention_date - expected_retention).total_seconds()) < 60
+        head = s3_test_client.head_object(Bucket=mock_s3_bucket, Key=key)
+        assert head["ObjectLockRetainUntilDate"] == retention_date
 
-    def test_upload_artifact_failure(self, mock_s3_bucket: str) -> None:
+    def test_upload_artifact_failure(
+        self, mock_s3_bucket: str, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test artifact upload failure handling."""
-        key = "test/artifact.pdf"
-        data = b"test content"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            # Mock S3 client error
-            mock_client.put_object.side_effect = ClientError(
-                {"Error": {"Code": "AccessDenied", "Message": "Access Denied"}}, "PutObject"
-            )
-
-            with pytest.raises(ClientError):
-                upload_artifact(key, data)
-
-    def test_upload_artifact_empty_data(self, mock_s3_bucket: str) -> None:
-        """Test artifact upload with empty data."""
-        key = "test/empty.pdf"
-        data = b""
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.put_object.return_value = {"VersionId": "empty-version"}
-
-            result = upload_artifact(key, data)
-
-            assert result["key"] == key
-            assert result["version_id"] == "empty-version"
-
-            # Verify put_object was called with empty data
-            call_kwargs = mock_client.put_object.call_args[1]
-            assert call_kwargs["Body"] == b""
-
-    def test_upload_artifact_no_metadata(self, mock_s3_bucket: str) -> None:
-        """Test artifact upload with no metadata."""
-        key = "test/no-metadata.pdf"
+        key = "upload/failure.pdf"
         data = b"test content"
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.put_object.return_value = {"VersionId": "no-meta-version"}
-
-            result = upload_artifact(key, data, metadata=None)
+        # Point the upload at a bucket that doesn't exist
+        monkeypatch.setattr(settings, "s3_bucket_artifacts", "missing-bucket")
 
-            assert result["key"] == key
-
-            # Verify metadata still includes compliance fields
-            call_kwargs = mock_client.put_object.call_args[1]
-            metadata = call_kwargs["Metadata"]
-            assert "captured-at" in metadata
-            assert "retention-until" in metadata
+        with pytest.raises(ClientError):
+            upload_artifact(key, data)
 
 
 class TestGetArtifact:
     """Test artifact retrieval functionality."""
 
-    def test_get_artifact_success(self, mock_s3_bucket: str) -> None:
-        """Test successful artifact retrieval."""
-        key = "test/artifact.pdf"
-        expected_data = b"test artifact content"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            # Mock successful get_object response
-            mock_response = MagicMock()
-            mock_response.read.return_value = expected_data
-            mock_client.get_object.return_value = {"Body": mock_response}
-
-            result = get_artifact(key)
-
-            assert result == expected_data
-            mock_client.get_object.assert_called_once_with(
-                Bucket="test-artifacts-bucket",
-                Key=key,
-            )
-
-    def test_get_artifact_with_version(self, mock_s3_bucket: str) -> None:
-        """Test artifact retrieval with specific version."""
-        key = "test/artifact.pdf"
-        version_id = "test-version-123"
-        expected_data = b"test content"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            mock_response = MagicMock()
-            mock_response.read.return_value = expected_data
-            mock_client.get_object.return_value = {"Body": mock_response}
-
-            result = get_artifact(key, version_id)
-
-            assert result == expected_data
-            mock_client.get_object.assert_called_once_with(
-                Bucket="test-artifacts-bucket",
-                Key=key,
-                VersionId=version_id,
-            )
+    @pytest.mark.parametrize(
+        ("key", "version", "expected"),
+        [
+            pytest.param("get/latest.pdf", None, b"newer content", id="latest"),
+            pytest.param("get/versioned.pdf", "first", b"test content", id="with_version"),
+            # An unknown version falls back to the latest one
+            pytest.param("get/unknown.pdf", _UNKNOWN_VERSION_ID, b"newer content", id="unknown"),
+        ],
+    )
+    def test_get_artifact(
+        self,
+        mock_s3_bucket: str,
+        s3_test_client: Any,
+        key: str,
+        version: str | None,
+        expected: bytes,
+    ) -> None:
+        """Test artifact retrieval of the latest, a specific or an unknown version."""
+        first_version = _put_plain_object(s3_test_client, mock_s3_bucket, key, b"test content")
+        _put_plain_object(s3_test_client, mock_s3_bucket, key, b"newer content")
+
+        result = get_artifact(key, first_version if version == "first" else version)
+
+        # Reason: moto returns a real StreamingBody, so this covers the Body.read() path
+        assert result == expected
 
     def test_get_artifact_failure(self, mock_s3_bucket: str) -> None:
         """Test artifact retrieval failure handling."""
         key = "nonexistent/artifact.pdf"
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            mock_client.get_object.side_effect = ClientError(
-                {"Error": {"Code": "NoSuchKey", "Message": "Key not found"}}, "GetObject"
-            )
-
-            with pytest.raises(ClientError):
-                get_artifact(key)
+        with pytest.raises(ClientError):
+            get_artifact(key)
 
 
 class TestGetArtifactMetadata:
@@ -221,75 +203,48 @@ class TestGetArtifactMetadata:
 
     def test_get_artifact_metadata_success(self, mock_s3_bucket: str) -> None:
         """Test successful metadata retrieval."""
-        key = "test/artifact.pdf"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-
-            # Mock head_object response
-            mock_client.head_object.return_value = {
-                "ContentLength": 1024,
-                "ETag": '"test-etag"',
-                "LastModified": datetime.now(UTC),
-                "VersionId": "test-version",
-                "ObjectLockMode": "COMPLIANCE",
-                "ObjectLockRetainUntilDate": datetime.now(UTC) + timedelta(days=365),
-                "Metadata": {"custom": "value"},
-            }
-
-            result = get_artifact_metadata(key)
-
-            assert result["key"] == key
-            assert result["size"] == 1024
-            assert result["etag"] == '"test-etag"'
-            assert result["object_lock_mode"] == "COMPLIANCE"
-            assert "last_modified" in result
-            assert "version_id" in result
-            assert "object_lock_retain_until" in result
-            assert result["metadata"] == {"custom": "value"}
-
-    def test_get_artifact_metadata_with_version(self, mock_s3_bucket: str) -> None:
+        key = "metadata/success.pdf"
+        data = b"x" * 1024
+        upload = upload_artifact(key, data, {"custom": "value"})
+
+        result = get_artifact_metadata(key)
+
+        assert result["key"] == key
+        assert result["size"] == 1024
+        assert result["etag"] == upload["etag"]
+        assert result["object_lock_mode"] == "COMPLIANCE"
+        assert "last_modified" in result
+        assert result["version_id"] == upload["version_id"]
+        assert "object_lock_retain_until" in result
+        assert result["metadata"]["custom"] == "value"
+
+    def test_get_artifact_metadata_with_version(
+        self, mock_s3_bucket: str, s3_test_client: Any
+    ) -> None:
         """Test metadata retrieval with specific version."""
-        key = "test/artifact.pdf"
-        version_id = "test-version-123"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.head_object.return_value = {"ContentLength": 512}
+        key = "metadata/versioned.pdf"
+        version_id = _put_plain_object(s3_test_client, mock_s3_bucket, key, b"x" * 512)
+        _put_plain_object(s3_test_client, mock_s3_bucket, key, b"x" * 64)
 
-            get_artifact_metadata(key, version_id)
+        result = get_artifact_metadata(key, version_id)
 
-            mock_client.head_object.assert_called_once_with(
-                Bucket="test-artifacts-bucket",
-                Key=key,
-                VersionId=version_id,
-            )
+        assert result["version_id"] == version_id
+        assert result["size"] == 512
 
-    def test_get_artifact_metadata_minimal_response(self, mock_s3_bucket: str) -> None:
-        """Test metadata retrieval with minimal S3 response."""
-        key = "test/minimal.pdf"
+    def test_get_artifact_metadata_minimal_response(
+        self, mock_s3_bucket: str, s3_test_client: Any
+    ) -> None:
+        """Test metadata retrieval for an object without Object Lock or metadata."""
+        key = "metadata/minimal.pdf"
+        _put_plain_object(s3_test_client, mock_s3_bucket, key, b"x" * 256)
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
+        result = get_artifact_metadata(key)
 
-            # Mock minimal response with only required fields
-            mock_client.head_object.return_value = {
-                "ContentLength": 256,
-            }
-
-            result = get_artifact_metadata(key)
-
-            assert result["key"] == key
-            assert result["size"] == 256
-            assert result["etag"] is None
-            assert result["last_modified"] is None
-            assert result["version_id"] is None
-            assert result["object_lock_mode"] is None
-            assert result["object_lock_retain_until"] is None
-            assert result["metadata"] == {}
+        assert result["key"] == key
+        assert result["size"] == 256
+        assert result["object_lock_mode"] is None
+        assert result["object_lock_retain_until"] is None
+        assert result["metadata"] == {}
 
 
 class TestPresignDownload:
@@ -298,94 +253,57 @@ class TestPresignDownload:
     def test_presign_download_default_ttl(self, mock_s3_bucket: str) -> None:
         """Test presigned URL generation with default TTL."""
         key = "test/artifact.pdf"
-        expected_url = "https://s3.amazonaws.com/test-bucket/test-key"
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.generate_presigned_url.return_value = expected_url
+        result = presign_download(key)
 
-            result = presign_download(key)
-
-            assert result == expected_url
-            mock_client.generate_presigned_url.assert_called_once_with(
-                "get_object",
-                Params={"Bucket": "test-artifacts-bucket", "Key": key},
-                ExpiresIn=300,  # Default from settings
-            )
+        parsed = urlparse(result)
+        assert parsed.hostname == f"{mock_s3_bucket}.s3.amazonaws.com"
+        assert parsed.path == f"/{key}"
+        assert _expires_in(result) == 300  # Default from settings
 
     def test_presign_download_custom_ttl(self, mock_s3_bucket: str) -> None:
         """Test presigned URL generation with custom TTL."""
         key = "test/artifact.pdf"
         expires = 600  # 10 minutes
-        expected_url = "https://s3.amazonaws.com/test-bucket/test-key"
-
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.generate_presigned_url.return_value = expected_url
 
-            result = presign_download(key, expires)
+        result = presign_download(key, expires)
 
-            assert result == expected_url
-            mock_client.generate_presigned_url.assert_called_once_with(
-                "get_object",
-                Params={"Bucket": "test-artifacts-bucket", "Key": key},
-                ExpiresIn=expires,
-            )
+        assert urlparse(result).path == f"/{key}"
+        assert _expires_in(result) == expires
 
     def test_presign_download_ttl_cap(self, mock_s3_bucket: str) -> None:
         """Test that TTL is capped at 15 minutes (900 seconds)."""
         key = "test/artifact.pdf"
         expires = 1800  # 30 minutes (should be capped to 900)
 
-        with patch("app.storage.s3.s3_client") as mock_s3_client:
-            mock_client = MagicMock()
-            mock_s3_client.return_value = mock_client
-            mock_client.generate_presigned_url.return_value = "test-url"
+        result = presign_download(key, expires)
 
-            presign_download(key, expires)
-
-            # Verify TTL was capped at 900 seconds
-            call_kwargs = mock_client.generate_presigned_url.call_args[1]
-            assert call_kwargs["ExpiresIn"] == 900
+        # Verify TTL was capped at 900 seconds
+        assert _expires_in(result) == 900
 
 
 class TestVerifyObjectLock:
     """Test Object Lock verification."""
 
-    def test_verify_object_lock_true(self, mock_s3_bucket: str) -> None:
-        """Test verification when Object Lock is properly set."""
-        key = "test/artifact.pdf"
-
-        with patch("app.storage.s3.get_artifact_metadata") as mock_metadata:
-            mock_metadata.return_value = {"object_lock_mode": "COMPLIANCE"}
-
-            result = verify_object_lock(key)
-
-            assert result is True
-            mock_metadata.assert_called_once_with(key)
-
-    def test_verify_object_lock_false(self, mock_s3_bucket: str) -> None:
-        """Test verification when Object Lock is not set."""
-        key = "test/artifact.pdf"
-
-        with patch("app.storage.s3.get_artifact_metadata") as mock_metadata:
-            mock_metadata.return_value = {"object_lock_mode": None}
-
-            result = verify_object_lock(key)
-
-            assert result is False
-
-    def test_verify_object_lock_error(self, mock_s3_bucket: str) -> None:
-        """Test verification when metadata retrieval fails."""
-        key = "test/artifact.pdf"
-
-        with patch("app.storage.s3.get_artifact_metadata") as mock_metadata:
-            mock_metadata.side_effect = ClientError(
-                {"Error": {"Code": "NoSuchKey", "Message": "Key not found"}}, "HeadObject"
-            )
-
-            result = verify_object_lock(key)
-
-            assert result is False
+    @pytest.mark.parametrize(
+        ("stored", "expected"),
+        [
+            pytest.param("locked", True, id="locked"),
+            pytest.param("unlocked", False, id="unlocked"),
+            # Metadata retrieval fails for a missing object
+            pytest.param(None, False, id="error"),
+        ],
+    )
+    def test_verify_object_lock(
+        self, mock_s3_bucket: str, s3_test_client: Any, stored: str | None, expected: bool
+    ) -> None:
+        """Test verification for locked, unlocked and missing objects."""
+        key = f"lock/{stored or 'missing'}.pdf"
+        if stored == "locked":
+            upload_artifact(key, b"locked content")
+        elif stored == "unlocked":
+            _put_plain_object(s3_test_client, mock_s3_bucket, key, b"unlocked content")
+
+        result = verify_object_lock(key)
+
+        assert result is expected